@@ -1,28 +1,49 @@
+import atexit
+import fnmatch
+import itertools
+import logging.handlers
+import os
+import queue
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from loguru import logger
-from rich import print
-
-from .config.config_models import AppConfig
-from .config.styles import (
-    console,
-    print_duplicates,
-    print_error,
-    print_header,
-    print_history,
-    print_info,
-    print_provider_list,
-    print_section,
-    print_statistics,
-    print_success,
-    print_warning,
+
+if TYPE_CHECKING:
+    from .config.config_models import AppConfig
+    from .core.service import BackupService
+
+# Image extensions recognized for directory uploads (kept stdlib-only here
+# so the module import path stays light; mirrors SUPPORTED_IMAGE_EXTENSIONS
+# in providers.base)
+_IMAGE_EXTS = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".bmp",
+        ".webp",
+        ".svg",
+        ".tiff",
+        ".tif",
+        ".ico",
+    }
 )
-from .core.service import BackupService
+
+# Precomputed file-sink settings; parsed once at import instead of per
+# setup_logging call (tests call it repeatedly)
+_LOG_FILE = "logs/host_image_backup.log"
+_LOG_MAX_BYTES = 5 * 1024 * 1024
+_LOG_BACKUP_COUNT = 7
 
 app = typer.Typer(
     name="host-image-backup",
     no_args_is_help=False,
+    add_completion=False,
+    rich_markup_mode=None,
+    pretty_exceptions_enable=False,
 )
 
 # Create sub-apps for command groups
@@ -62,6 +83,18 @@ data_app = typer.Typer(
 app.add_typer(data_app)
 
 
+class _LazyRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that creates the log directory on first open.
+
+    Combined with ``delay=True`` this keeps the logs directory and file
+    untouched until a record is actually emitted.
+    """
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
 def setup_logging(verbose: bool = False) -> None:
     """Setup logging
 
@@ -70,25 +103,37 @@ def setup_logging(verbose: bool = False) -> None:
     verbose : bool, default=False
         Whether to enable verbose logging.
     """
+    from loguru import logger
+
     level = "DEBUG" if verbose else "INFO"
     logger.remove()  # Remove default logger
 
-    # Ensure logs directory exists
-    logs_dir = Path("logs")
-    logs_dir.mkdir(exist_ok=True)
+    # File logging goes through a queue so rotation and disk writes happen
+    # on a background listener thread instead of blocking log call sites.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    file_handler = _LazyRotatingFileHandler(
+        _LOG_FILE,
+        maxBytes=_LOG_MAX_BYTES,
+        backupCount=_LOG_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True,
+    )
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
 
     logger.add(
-        "logs/host_image_backup_{time}.log",
-        rotation="5 MB",
-        retention="1 week",
-        compression="zip",
+        logging.handlers.QueueHandler(log_queue),
         level=level,
         format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} | {message}",
     )
     if verbose:
+        # Hand loguru the stream directly: no per-record Python wrapper
+        # frame, and loguru can use its optimized colorizer
         logger.add(
-            lambda msg: print(msg, end=""),
+            sys.stderr,
             level=level,
+            colorize=True,
             format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         )
 
@@ -105,18 +150,22 @@ def main(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed logs"),
     ctx: typer.Context = typer.Option(None),
 ) -> None:
-    setup_logging(verbose)
-
-    # if there is no subcommand, show help
+    # if there is no subcommand, show help (no logging setup needed)
     if ctx.invoked_subcommand is None:
-        console.print(ctx.get_help())
+        typer.echo(ctx.get_help())
         raise typer.Exit(code=0)
 
+    setup_logging(verbose)
+
     # For config init command, we don't need to load configuration
     if ctx.invoked_subcommand == "config" and ctx.args and ctx.args[0] == "init":
         return
 
-    # Load configuration for other commands
+    # Load configuration for other commands (imported here so help/init paths
+    # never pay for pydantic, yaml, and the provider modules)
+    from .config.config_models import AppConfig
+    from .core.service import BackupService
+
     app_config = AppConfig.load(config)
     # Create backup service
     backup_service = BackupService(app_config)
@@ -132,6 +181,9 @@ def main(
 @config_app.command("init")
 def config_init() -> None:
     """Initialize default configuration file"""
+    from .config.config_models import AppConfig
+    from .config.styles import print_info, print_success, print_warning
+
     # Check if config file already exists
     config_file = AppConfig.get_config_file()
     if config_file.exists():
@@ -164,18 +216,32 @@ def backup_start(
         "--skip-existing/--no-skip-existing",
         help="Skip existing files [default: skip-existing]",
     ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Clear cached listing data and re-fetch the full image list",
+    ),
     ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Backup images from the specified provider"""
+    from .config.styles import (
+        console,
+        print_error,
+        print_info,
+        print_section,
+        print_success,
+        print_warning,
+    )
+
     service: BackupService = ctx.obj["service"]
     config: AppConfig = ctx.obj["config"]
     verbose: bool = ctx.obj["verbose"]
 
-    # Check if provider exists
-    if provider not in service.list_providers():
+    # Check if provider exists (frozenset: one registry scan, O(1) lookup)
+    known_providers = frozenset(service.list_providers())
+    if provider not in known_providers:
         print_error(f"Unknown provider: {provider}")
-        available_providers = ", ".join(service.list_providers())
-        print_warning(f"Available providers: {available_providers}")
+        print_warning(f"Available providers: {', '.join(sorted(known_providers))}")
         raise typer.Exit(code=1)
 
     # Set output directory
@@ -191,6 +257,10 @@ def backup_start(
     if skip_existing:
         print_info("Skip existing files")
 
+    if refresh:
+        service.clear_listing_cache(provider)
+        print_info("Cleared cached listing data")
+
     # Execute backup
     success = service.backup_images(
         provider_name=provider,
@@ -213,9 +283,18 @@ def _backup_all_impl(
     output: Path | None,
     limit: int | None,
     skip_existing: bool,
+    parallel: bool,
     ctx: typer.Context,
 ) -> None:
     """Backup images from all enabled providers (shared implementation)"""
+    from .config.styles import (
+        console,
+        print_error,
+        print_section,
+        print_success,
+        print_warning,
+    )
+
     service: BackupService = ctx.obj["service"]
     config: AppConfig = ctx.obj["config"]
     verbose: bool = ctx.obj["verbose"]
@@ -239,23 +318,58 @@ def _backup_all_impl(
 
     success_count = 0
 
-    for provider_name in enabled_providers:
-        print_section(
-            f"Provider: {provider_name}", f"Starting to backup {provider_name}..."
-        )
-
-        success = service.backup_images(
-            provider_name=provider_name,
-            output_dir=output_dir,
-            limit=limit,
-            skip_existing=skip_existing,
-            verbose=verbose,
-        )
-
-        if success:
-            success_count += 1
-        else:
-            print_error(f"{provider_name} backup failed")
+    if parallel and len(enabled_providers) > 1:
+        # Providers are independent and network-bound, so backing them up
+        # concurrently gives near-linear speedup. All rendering happens on
+        # the main thread: per-provider progress bars and summary panels
+        # are suppressed (show_progress=False), otherwise several live
+        # Rich displays would interleave on one terminal.
+        import concurrent.futures
+
+        max_workers = min(len(enabled_providers), config.max_concurrent_downloads or 4)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(
+                    service.backup_images,
+                    provider_name=provider_name,
+                    output_dir=output_dir,
+                    limit=limit,
+                    skip_existing=skip_existing,
+                    verbose=verbose,
+                    show_progress=False,
+                ): provider_name
+                for provider_name in enabled_providers
+            }
+            for future in concurrent.futures.as_completed(futures):
+                provider_name = futures[future]
+                try:
+                    success = future.result()
+                except Exception as e:
+                    success = False
+                    print_error(f"{provider_name} backup error: {e}")
+                if success:
+                    success_count += 1
+                    print_success(f"{provider_name} backup completed")
+                else:
+                    print_error(f"{provider_name} backup failed")
+    else:
+        for provider_name in enabled_providers:
+            print_section(
+                f"Provider: {provider_name}", f"Starting to backup {provider_name}..."
+            )
+
+            success = service.backup_images(
+                provider_name=provider_name,
+                output_dir=output_dir,
+                limit=limit,
+                skip_existing=skip_existing,
+                verbose=verbose,
+            )
+
+            if success:
+                success_count += 1
+            else:
+                print_error(f"{provider_name} backup failed")
 
     console.print()  # Add empty line before result
     if success_count == len(enabled_providers):
@@ -284,9 +398,14 @@ def backup_all(
         "--skip-existing/--no-skip-existing",
         help="Skip existing files [default: skip-existing]",
     ),
+    parallel: bool = typer.Option(
+        True,
+        "--parallel/--no-parallel",
+        help="Backup providers concurrently [default: parallel]",
+    ),
     ctx: typer.Context = typer.Option(None),
 ) -> None:
-    _backup_all_impl(output, limit, skip_existing, ctx)
+    _backup_all_impl(output, limit, skip_existing, parallel, ctx)
 
 
 @app.command("backup-all")
@@ -302,14 +421,21 @@ def backup_all_cli(
         "--skip-existing/--no-skip-existing",
         help="Skip existing files [default: skip-existing]",
     ),
+    parallel: bool = typer.Option(
+        True,
+        "--parallel/--no-parallel",
+        help="Backup providers concurrently [default: parallel]",
+    ),
     ctx: typer.Context = typer.Option(None),
 ) -> None:
-    _backup_all_impl(output, limit, skip_existing, ctx)
+    _backup_all_impl(output, limit, skip_existing, parallel, ctx)
 
 
 @provider_app.command("list")
 def provider_list(ctx: typer.Context = typer.Option(None)) -> None:
     """List all available providers"""
+    from .config.styles import print_provider_list
+
     service: BackupService = ctx.obj["service"]
     config: AppConfig = ctx.obj["config"]
 
@@ -334,6 +460,8 @@ def provider_test(
     ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Test connection to the specified provider"""
+    from .config.styles import print_error, print_info, print_success
+
     service: BackupService = ctx.obj["service"]
 
     if provider not in service.list_providers():
@@ -356,6 +484,8 @@ def provider_info(
     ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Show detailed information for the specified provider"""
+    from .config.styles import print_error
+
     service: BackupService = ctx.obj["service"]
 
     if provider not in service.list_providers():
@@ -377,14 +507,22 @@ def upload(
     ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Upload a single image to the specified provider"""
+    from .config.styles import (
+        print_error,
+        print_info,
+        print_section,
+        print_success,
+        print_warning,
+    )
+
     service: BackupService = ctx.obj["service"]
     verbose: bool = ctx.obj["verbose"]
 
-    # Check if provider exists
-    if provider not in service.list_providers():
+    # Check if provider exists (frozenset: one registry scan, O(1) lookup)
+    known_providers = frozenset(service.list_providers())
+    if provider not in known_providers:
         print_error(f"Unknown provider: {provider}")
-        available_providers = ", ".join(service.list_providers())
-        print_warning(f"Available providers: {available_providers}")
+        print_warning(f"Available providers: {', '.join(sorted(known_providers))}")
         raise typer.Exit(code=1)
 
     print_section("Upload", f"Uploading {file.name} to {provider}")
@@ -429,47 +567,37 @@ def upload_all(
     ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Upload multiple images from a directory to the specified provider"""
+    from .config.styles import (
+        print_error,
+        print_section,
+        print_success,
+        print_warning,
+    )
+
     service: BackupService = ctx.obj["service"]
     verbose: bool = ctx.obj["verbose"]
 
-    # Check if provider exists
-    if provider not in service.list_providers():
+    # Check if provider exists (frozenset: one registry scan, O(1) lookup)
+    known_providers = frozenset(service.list_providers())
+    if provider not in known_providers:
         print_error(f"Unknown provider: {provider}")
-        available_providers = ", ".join(service.list_providers())
-        print_warning(f"Available providers: {available_providers}")
+        print_warning(f"Available providers: {', '.join(sorted(known_providers))}")
         raise typer.Exit(code=1)
 
-    image_extensions = {
-        ".jpg",
-        ".jpeg",
-        ".png",
-        ".gif",
-        ".bmp",
-        ".webp",
-        ".svg",
-        ".tiff",
-        ".tif",
-        ".ico",
-    }
-
-    pattern_with_ext = f"{pattern}*"
-    if not any(pattern.lower().endswith(ext) for ext in image_extensions):
-        # Add all image extensions if pattern doesn't specify extension
-        files_to_upload = []
-        for ext in image_extensions:
-            files_to_upload.extend(directory.glob(f"{pattern}*{ext}"))
-    else:
-        files_to_upload = list(directory.glob(pattern_with_ext))
-
-    # Filter only existing image files
-    files_to_upload = [
-        f
-        for f in files_to_upload
-        if f.is_file() and f.suffix.lower() in image_extensions
-    ]
-
-    if limit:
-        files_to_upload = files_to_upload[:limit]
+    # Single directory pass: DirEntry.is_file avoids the extra stat per file
+    # that the old per-extension glob + filter double-pass paid. Streaming
+    # through islice stops scanning once the limit is reached.
+    with os.scandir(directory) as entries:
+        candidates = (
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file(follow_symlinks=False)
+            and os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTS
+            and fnmatch.fnmatch(entry.name, f"{pattern}*")
+        )
+        files_to_upload = (
+            list(itertools.islice(candidates, limit)) if limit else list(candidates)
+        )
 
     if not files_to_upload:
         print_warning(f"No image files found matching pattern: {pattern}")
@@ -503,6 +631,8 @@ def stats(
     ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Show backup statistics and summary information"""
+    from .config.styles import console, print_header, print_statistics
+
     service: BackupService = ctx.obj["service"]
 
     stats = service.metadata_manager.get_statistics()
@@ -512,8 +642,12 @@ def stats(
     if detailed and stats["operations_by_type"]:
         console.print()
         print_header("Operations by Type:")
-        for op_type, count in stats["operations_by_type"].items():
-            console.print(f"  {op_type}: {count}")
+        console.print(
+            "\n".join(
+                f"  {op_type}: {count}"
+                for op_type, count in stats["operations_by_type"].items()
+            )
+        )
 
 
 @data_app.command("history")
@@ -527,12 +661,16 @@ def history(
     ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Show backup operation history records"""
+    from .config.styles import print_history
+
     service: BackupService = ctx.obj["service"]
 
+    # Cap at the query layer so the database LIMITs instead of fetching the
+    # full history and discarding most rows at render time
     records = service.metadata_manager.get_backup_records(
         operation=None,
         provider=provider,
-        limit=limit,
+        limit=min(limit, 20) if limit else 20,
     )
 
     print_history(records)
@@ -541,21 +679,27 @@ def history(
 @data_app.command("duplicates")
 def duplicates(ctx: typer.Context = typer.Option(None)) -> None:
     """Find and display duplicate files"""
+    from .config.styles import print_duplicates
+
     service: BackupService = ctx.obj["service"]
 
-    duplicates = service.metadata_manager.find_duplicates()
+    duplicates = service.metadata_manager.find_duplicates(max_results=10)
     print_duplicates(duplicates)
 
 
 @data_app.command("cleanup")
 def cleanup() -> None:
     """Clean up backup files and metadata"""
+    from .config.styles import print_warning
+
     print_warning("Cleanup functionality not yet implemented")
 
 
 @data_app.command("verify")
 def verify() -> None:
     """Verify backup file integrity"""
+    from .config.styles import print_warning
+
     print_warning("Verification functionality not yet implemented")
 
 
@@ -584,6 +728,8 @@ def compress(
     ctx: typer.Context = typer.Option(None),
 ) -> None:
     """Compress images with high fidelity"""
+    from .config.styles import print_error, print_section, print_success
+
     service: BackupService = ctx.obj["service"]
     verbose: bool = ctx.obj["verbose"]
 
@@ -1,3 +1,5 @@
+import os
+import pickle
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +22,39 @@ except Exception:
     entry_points = None
     EntryPoint = object
 
+# msgspec decodes the sentinel cache several times faster than pickle;
+# optional (the "fast" extra), with pickle as the fallback format
+try:
+    import msgspec
+
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder()
+except ImportError:
+    msgspec = None
+
+# Prefer the libyaml-backed loader/dumper when PyYAML was built against it;
+# the pure-Python fallback is an order of magnitude slower on real configs.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+if _YAML_LOADER is yaml.SafeLoader:
+    logger.debug("libyaml not available, falling back to pure-Python YAML loader")
+
+# Top-level settings and their defaults, applied with a single dict merge
+# instead of one .get call per key
+# Built-in provider names as a frozenset for the hot membership checks
+_SUPPORTED_NAMES = frozenset({"oss", "cos", "sms", "imgur", "github"})
+
+_CONFIG_DEFAULTS = {
+    "default_output_dir": "./backup",
+    "max_concurrent_downloads": 5,
+    "timeout": 30,
+    "retry_count": 3,
+    "retry_backoff_base": 0.5,
+    "retry_backoff_cap": 30.0,
+    "chunk_size": 8192,
+    "log_level": "INFO",
+}
+
 
 class ConfigManager:
     """Configuration manager for Host Image Backup.
@@ -33,6 +68,10 @@ class ConfigManager:
         Path to configuration file. If None, uses default location.
     """
 
+    # Default config path resolved (and its directory created) once per
+    # process; _get_config_file runs on every load and save
+    _DEFAULT_CONFIG_FILE: Path | None = None
+
     def __init__(self, config_path: Path | None = None):
         """Initialize configuration manager."""
         self._config_path = config_path
@@ -44,6 +83,7 @@ class ConfigManager:
             "imgur": ImgurConfig,
             "github": GitHubConfig,
         }
+        self._supported_names: frozenset[str] = _SUPPORTED_NAMES
         self._discovered = False
 
     @property
@@ -59,13 +99,20 @@ class ConfigManager:
             self._config = self.load_config()
         return self._config
 
-    def load_config(self, config_path: Path | None = None) -> AppConfig:
+    def load_config(
+        self, config_path: Path | None = None, *, trusted: bool = False
+    ) -> AppConfig:
         """Load configuration from file.
 
         Parameters
         ----------
         config_path : Path, optional
             Path to configuration file. If None, uses default location.
+        trusted : bool, default=False
+            Skip Pydantic validation and build models with
+            ``model_construct``. Only safe for data this tool wrote
+            itself (e.g. a file that validated cleanly on a previous
+            run); user-edited configs should keep full validation.
 
         Returns
         -------
@@ -89,9 +136,22 @@ class ConfigManager:
             logger.warning(f"Configuration file not found: {config_path}")
             return AppConfig()
 
+        # One stat serves the empty-file guard and the cache key
+        st = config_path.stat()
+        if st.st_size == 0:
+            return AppConfig()
+
+        # Sentinel cache: if the YAML has not changed since the last parse,
+        # load the cached AppConfig and skip YAML + Pydantic entirely
+        cache_key = (st.st_mtime_ns, st.st_size)
+        cached = self._read_cache(self._cache_file(config_path), cache_key)
+        if cached is not None:
+            self._config = cached
+            return self._config
+
         try:
             with open(config_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
         except yaml.YAMLError as e:
             logger.error(f"Failed to parse configuration file: {e}")
             raise
@@ -101,14 +161,10 @@ class ConfigManager:
 
         # Create base config
         config_data = {
-            "default_output_dir": data.get("default_output_dir", "./backup"),
-            "max_concurrent_downloads": data.get("max_concurrent_downloads", 5),
-            "timeout": data.get("timeout", 30),
-            "retry_count": data.get("retry_count", 3),
-            "chunk_size": data.get("chunk_size", 8192),
-            "log_level": data.get("log_level", "INFO"),
-            "providers": {},
+            **_CONFIG_DEFAULTS,
+            **{k: data[k] for k in _CONFIG_DEFAULTS if k in data},
         }
+        config_data["providers"] = {}
 
         # Load provider configurations
         providers_data = data.get("providers", {})
@@ -116,13 +172,25 @@ class ConfigManager:
             if provider_name in providers_data:
                 provider_data = providers_data[provider_name]
                 try:
-                    config_data["providers"][provider_name] = provider_class(
-                        name=provider_name, **provider_data
-                    )
+                    if trusted:
+                        config_data["providers"][provider_name] = (
+                            provider_class.model_construct(
+                                name=provider_name, **provider_data
+                            )
+                        )
+                    else:
+                        config_data["providers"][provider_name] = provider_class(
+                            name=provider_name, **provider_data
+                        )
                 except Exception as e:
                     logger.warning(f"Failed to load {provider_name} config: {e}")
 
-        self._config = AppConfig(**config_data)
+        self._config = (
+            AppConfig.model_construct(**config_data)
+            if trusted
+            else AppConfig(**config_data)
+        )
+        self._write_cache(self._cache_file(config_path), cache_key, self._config)
         return self._config
 
     def save_config(
@@ -160,22 +228,37 @@ class ConfigManager:
                 "max_concurrent_downloads": config.max_concurrent_downloads,
                 "timeout": config.timeout,
                 "retry_count": config.retry_count,
+                "retry_backoff_base": config.retry_backoff_base,
+                "retry_backoff_cap": config.retry_backoff_cap,
                 "chunk_size": config.chunk_size,
                 "log_level": config.log_level,
                 "providers": {},
             }
 
-            # Serialize provider configurations
+            # Serialize provider configurations; the per-class field tuple
+            # is fixed at class creation, so plain getattr replaces
+            # Pydantic's generic dump machinery here
             for name, provider in config.providers.items():
-                data["providers"][name] = provider.dict(exclude={"name"})
+                data["providers"][name] = {
+                    f: getattr(provider, f) for f in type(provider)._DUMP_FIELDS
+                }
 
             with open(config_path, "w", encoding="utf-8") as f:
                 yaml.dump(
-                    data, f, default_flow_style=False, allow_unicode=True, indent=2
+                    data,
+                    f,
+                    Dumper=_YAML_DUMPER,
+                    default_flow_style=False,
+                    allow_unicode=True,
+                    indent=2,
                 )
 
             logger.info(f"Configuration saved to: {config_path}")
 
+            # Invalidate the sentinel cache; the next load re-parses and
+            # rewrites it with the new mtime/size key
+            self._cache_file(config_path).unlink(missing_ok=True)
+
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
             raise
@@ -264,7 +347,7 @@ class ConfigManager:
         ValueError
             If provider is not supported.
         """
-        if provider_name not in self._provider_classes:
+        if provider_name not in self._supported_names:
             raise ValueError(f"Unsupported provider: {provider_name}")
 
         provider_class = self._provider_classes[provider_name]
@@ -308,9 +391,96 @@ class ConfigManager:
         if self._config_path:
             return self._config_path
 
-        config_dir = Path.home() / ".config" / "host-image-backup"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir / "config.yaml"
+        if type(self)._DEFAULT_CONFIG_FILE is None:
+            config_dir = Path.home() / ".config" / "host-image-backup"
+            config_dir.mkdir(parents=True, exist_ok=True)
+            type(self)._DEFAULT_CONFIG_FILE = config_dir / "config.yaml"
+        return type(self)._DEFAULT_CONFIG_FILE
+
+    # -------- Parsed-config sentinel cache --------
+    @staticmethod
+    def _cache_file(config_path: Path) -> Path:
+        """Get the sentinel cache path for a configuration file.
+
+        Parameters
+        ----------
+        config_path : Path
+            Path to the configuration file.
+
+        Returns
+        -------
+        Path
+            Path of the pickle cache stored next to the configuration file.
+        """
+        return config_path.with_name(f".{config_path.name}.cache.pkl")
+
+    def _read_cache(self, cache_file: Path, key: tuple[int, int]) -> AppConfig | None:
+        """Load a cached AppConfig if the key still matches.
+
+        With msgspec installed the cache is a msgpack document of plain
+        dicts rebuilt through ``model_construct``; otherwise it is a
+        pickled ``(key, AppConfig)`` pair.
+
+        Returns
+        -------
+        AppConfig or None
+            Cached configuration, or None on miss or any read error.
+        """
+        try:
+            with open(cache_file, "rb") as f:
+                buf = f.read()
+            if msgspec is not None:
+                payload = _MSGPACK_DECODER.decode(buf)
+                if payload.get("key") != list(key):
+                    return None
+                providers = {}
+                for name, fields in payload.get("providers", {}).items():
+                    provider_class = self._provider_classes.get(name)
+                    if provider_class is None:
+                        return None
+                    providers[name] = provider_class.model_construct(
+                        name=name, **fields
+                    )
+                return AppConfig.model_construct(
+                    **payload.get("top", {}), providers=providers
+                )
+            cached_key, config = pickle.loads(buf)
+            if cached_key == key and isinstance(config, AppConfig):
+                return config
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unusable config cache {cache_file}: {e}")
+        return None
+
+    def _write_cache(
+        self, cache_file: Path, key: tuple[int, int], config: AppConfig
+    ) -> None:
+        """Write the parsed AppConfig to the sentinel cache atomically.
+
+        Best-effort: any failure is logged at debug level and ignored.
+        """
+        try:
+            if msgspec is not None:
+                payload = {
+                    "key": list(key),
+                    "top": {k: getattr(config, k) for k in _CONFIG_DEFAULTS},
+                    "providers": {
+                        name: {
+                            f: getattr(provider, f) for f in type(provider)._DUMP_FIELDS
+                        }
+                        for name, provider in config.providers.items()
+                    },
+                }
+                buf = _MSGPACK_ENCODER.encode(payload)
+            else:
+                buf = pickle.dumps((key, config), protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_file = cache_file.with_suffix(".tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(buf)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.debug(f"Failed to write config cache {cache_file}: {e}")
 
     # -------- Dynamic discovery of provider config --------
     def _ensure_discovery(self) -> None:
@@ -344,6 +514,7 @@ class ConfigManager:
                         )
                         continue
                     self._provider_classes[name] = obj
+                    self._supported_names |= {name}
                     added.append(name)
                 except Exception as exc:
                     logger.error(
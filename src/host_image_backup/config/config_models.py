@@ -1,4 +1,7 @@
+import json
+import os
 from pathlib import Path
+from typing import Any
 
 import yaml
 from loguru import logger
@@ -10,6 +13,10 @@ except Exception:
     entry_points = None
     EntryPoint = object
 
+# Prefer the LibYAML C loader when PyYAML was built with it; it parses
+# several times faster than the pure-Python SafeLoader.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ProviderConfig(BaseModel):
     """Base configuration class for image hosting providers.
@@ -34,6 +41,17 @@ class ProviderConfig(BaseModel):
     enabled: bool = Field(default=True, description="Whether the provider is enabled")
     prefix: str = Field(default="", description="Prefix path for images")
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute the serialized field names for each subclass.
+
+        ``save_config`` dumps every provider without its ``name`` field;
+        fixing the tuple at class-creation time lets it use plain
+        ``getattr`` instead of Pydantic's generic dump machinery.
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._DUMP_FIELDS = tuple(f for f in cls.model_fields if f != "name")
+
     def validate_config(self) -> bool:
         """Validate the provider configuration.
 
@@ -54,6 +72,12 @@ class ProviderConfig(BaseModel):
         ConfigRegistry.register(name, cls)
 
 
+# The base class misses the subclass hook; give it the same tuple
+ProviderConfig._DUMP_FIELDS = tuple(
+    f for f in ProviderConfig.model_fields if f != "name"
+)
+
+
 class ConfigRegistry:
     """Central registry for ProviderConfig classes.
 
@@ -138,6 +162,14 @@ class OSSConfig(ProviderConfig):
         The bucket name.
     endpoint : str, default=""
         The OSS endpoint URL.
+    image_prefixes : list of str, optional
+        Prefixes under which images live (e.g. per-directory). When
+        set, listing only asks the server for these prefixes instead of
+        scanning everything under ``prefix``.
+    list_shards : list of str, optional
+        Key-space shards appended to ``prefix`` (e.g. hex digits for
+        hashed keys). When set, each shard is listed in its own thread,
+        parallelizing enumeration of very large buckets.
 
     Examples
     --------
@@ -156,6 +188,14 @@ class OSSConfig(ProviderConfig):
     access_key_secret: str = Field(default="", description="OSS access key secret")
     bucket: str = Field(default="", description="OSS bucket name")
     endpoint: str = Field(default="", description="OSS endpoint")
+    image_prefixes: list[str] = Field(
+        default_factory=list,
+        description="Optional key prefixes to restrict server-side listing to",
+    )
+    list_shards: list[str] = Field(
+        default_factory=list,
+        description="Optional key-space shards listed concurrently, appended to prefix",
+    )
 
     def validate_config(self) -> bool:
         """Validate OSS configuration.
@@ -345,6 +385,10 @@ class AppConfig(BaseModel):
         Request timeout in seconds.
     retry_count : int, default=3
         Number of retry attempts for failed downloads.
+    retry_backoff_base : float, default=0.5
+        Base delay in seconds for exponential backoff between retries.
+    retry_backoff_cap : float, default=30.0
+        Upper bound in seconds for a single retry delay.
     chunk_size : int, default=8192
         Download chunk size in bytes.
     log_level : str, default="INFO"
@@ -373,6 +417,12 @@ class AppConfig(BaseModel):
     retry_count: int = Field(
         default=3, ge=0, le=10, description="Number of retry attempts"
     )
+    retry_backoff_base: float = Field(
+        default=0.5, ge=0.0, description="Base retry backoff delay in seconds"
+    )
+    retry_backoff_cap: float = Field(
+        default=30.0, ge=0.0, description="Maximum retry backoff delay in seconds"
+    )
     chunk_size: int = Field(
         default=8192, ge=1024, description="Download chunk size in bytes"
     )
@@ -464,15 +514,22 @@ class AppConfig(BaseModel):
             logger.warning(f"Configuration file not found: {config_path}")
             return cls()
 
-        try:
-            with open(config_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
-        except yaml.YAMLError as e:
-            logger.error(f"Failed to parse configuration file: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Failed to read configuration file: {e}")
-            raise
+        # Try the JSON snapshot cache first; it is keyed by mtime/size so a
+        # stale cache can never shadow an edited YAML file.
+        cache_path = cls._cache_file(config_path)
+        data = cls._read_cache(cache_path)
+
+        if data is None:
+            try:
+                with open(config_path, encoding="utf-8") as f:
+                    data = yaml.load(f, Loader=_YAML_SAFE_LOADER) or {}
+            except yaml.YAMLError as e:
+                logger.error(f"Failed to parse configuration file: {e}")
+                raise
+            except Exception as e:
+                logger.error(f"Failed to read configuration file: {e}")
+                raise
+            cls._write_cache(config_path, cache_path, data)
 
         # Create base config
         config_data = {
@@ -480,6 +537,8 @@ class AppConfig(BaseModel):
             "max_concurrent_downloads": data.get("max_concurrent_downloads", 5),
             "timeout": data.get("timeout", 30),
             "retry_count": data.get("retry_count", 3),
+            "retry_backoff_base": data.get("retry_backoff_base", 0.5),
+            "retry_backoff_cap": data.get("retry_backoff_cap", 30.0),
             "chunk_size": data.get("chunk_size", 8192),
             "log_level": data.get("log_level", "INFO"),
             "providers": {},
@@ -507,6 +566,79 @@ class AppConfig(BaseModel):
 
         return cls(**config_data)
 
+    @classmethod
+    def _cache_file(cls, config_path: Path) -> Path:
+        """Get JSON snapshot cache path for a configuration file.
+
+        The cache name embeds the YAML file's mtime and size, so editing
+        the configuration automatically invalidates the snapshot.
+
+        Parameters
+        ----------
+        config_path : Path
+            Path to the YAML configuration file.
+
+        Returns
+        -------
+        Path
+            Path to the sibling JSON cache file.
+        """
+        stat = config_path.stat()
+        return config_path.with_name(
+            f"{config_path.name}.{stat.st_mtime_ns}.{stat.st_size}.json"
+        )
+
+    @classmethod
+    def _read_cache(cls, cache_path: Path) -> dict | None:
+        """Read parsed configuration data from the JSON snapshot cache.
+
+        Parameters
+        ----------
+        cache_path : Path
+            Path to the JSON cache file.
+
+        Returns
+        -------
+        dict or None
+            Cached configuration data, or None if unavailable or unreadable.
+        """
+        if not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable config cache {cache_path}: {e}")
+            return None
+
+    @classmethod
+    def _write_cache(cls, config_path: Path, cache_path: Path, data: dict) -> None:
+        """Write parsed configuration data to the JSON snapshot cache.
+
+        Failures are logged and swallowed: the cache is a best-effort
+        optimization and must never break configuration loading.
+
+        Parameters
+        ----------
+        config_path : Path
+            Path to the YAML configuration file.
+        cache_path : Path
+            Path to the JSON cache file.
+        data : dict
+            Parsed configuration data to cache.
+        """
+        try:
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_path)
+            # Drop snapshots for older versions of the config file
+            for stale in config_path.parent.glob(f"{config_path.name}.*.json"):
+                if stale != cache_path:
+                    stale.unlink(missing_ok=True)
+        except Exception as e:
+            logger.debug(f"Failed to write config cache {cache_path}: {e}")
+
     def save(self, config_path: Path | None = None) -> None:
         """Save configuration to file.
 
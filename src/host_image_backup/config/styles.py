@@ -1,7 +1,8 @@
+import os.path
+import sys
 from pathlib import Path
 from typing import Any
 
-from rich import print as rich_print
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import (
@@ -12,32 +13,37 @@ from rich.progress import (
     TextColumn,
 )
 
-console = Console()
+# When stdout is piped there is no point paying for Rich's layout and
+# ANSI pipeline; table-like helpers fall back to plain tab-separated
+# output and the console drops color codes.
+_IS_TTY = sys.stdout.isatty()
+
+console = Console(no_color=not _IS_TTY)
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    rich_print(f"[green]✓ {message}[/green]")
+    console.print(f"[green]✓ {message}[/green]")
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    rich_print(f"[red]✗ {message}[/red]")
+    console.print(f"[red]✗ {message}[/red]")
 
 
 def print_warning(message: str) -> None:
     """Print a warning message."""
-    rich_print(f"[yellow]! {message}[/yellow]")
+    console.print(f"[yellow]! {message}[/yellow]")
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
-    rich_print(f"[blue]ℹ {message}[/blue]")
+    console.print(f"[blue]ℹ {message}[/blue]")
 
 
 def print_header(title: str) -> None:
     """Print a header with emphasis."""
-    rich_print(f"[bold blue]{title}[/bold blue]")
+    console.print(f"[bold blue]{title}[/bold blue]")
 
 
 def print_section(title: str, content: str = "") -> None:
@@ -76,8 +82,14 @@ def create_progress_bar() -> Progress:
     )
 
 
-def create_backup_progress_bar() -> Progress:
-    """Create a backup progress bar with consistent styling."""
+def create_backup_progress_bar(disable: bool = False) -> Progress:
+    """Create a backup progress bar with consistent styling.
+
+    Parameters
+    ----------
+    disable : bool, default=False
+        Render nothing; used when several backups share one terminal.
+    """
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}", style="cyan"),
@@ -91,21 +103,30 @@ def create_backup_progress_bar() -> Progress:
         TextColumn(
             "[progress.percentage]{task.completed}/{task.total} images", style="cyan"
         ),
+        disable=disable,
     )
 
 
 def print_provider_list(providers: list[tuple[str, str]]) -> None:
     """Print provider list in a clean format."""
+    if not _IS_TTY:
+        sys.stdout.write("".join(f"{name}\t{status}\n" for status, name in providers))
+        return
+
     print_header("Available Providers")
     console.print()
 
+    # Build all lines first and emit a single print; per-line console.print
+    # pays markup parsing and ANSI encoding for every call
+    lines = []
     for status, name in providers:
         status_icon = "[green]✓[/green]" if "Enabled" in status else "[red]✗[/red]"
         status_color = "green" if "Enabled" in status else "red"
-        console.print(
+        lines.append(
             f"{status_icon} {name} [{status_color}]({status})[/{status_color}]"
         )
 
+    console.print("\n".join(lines))
     console.print()
 
 
@@ -170,22 +191,42 @@ def print_compression_summary(success: int, error: int, skip: int, total: int) -
 
 def print_statistics(stats: dict[str, Any]) -> None:
     """Print backup statistics in a clean format."""
+    if not _IS_TTY:
+        lines = [
+            f"total_operations\t{stats['total_operations']}",
+            f"successful_operations\t{stats['successful_operations']}",
+            f"failed_operations\t{stats['failed_operations']}",
+            f"total_files\t{stats['total_files']}",
+            f"total_size\t{stats['total_size']}",
+        ]
+        lines.extend(
+            f"{op_type}\t{count}"
+            for op_type, count in stats["operations_by_type"].items()
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
+
     print_header("Backup Statistics")
     console.print()
 
-    console.print(f"[cyan]Total Operations:[/cyan] {stats['total_operations']}")
-    console.print(
-        f"[green]Successful Operations:[/green] {stats['successful_operations']}"
-    )
-    console.print(f"[red]Failed Operations:[/red] {stats['failed_operations']}")
-    console.print(f"[cyan]Total Files:[/cyan] {stats['total_files']}")
-    console.print(f"[cyan]Total Size:[/cyan] {stats['total_size']:,} bytes")
+    lines = [
+        f"[cyan]Total Operations:[/cyan] {stats['total_operations']}",
+        f"[green]Successful Operations:[/green] {stats['successful_operations']}",
+        f"[red]Failed Operations:[/red] {stats['failed_operations']}",
+        f"[cyan]Total Files:[/cyan] {stats['total_files']}",
+        f"[cyan]Total Size:[/cyan] {stats['total_size']:,} bytes",
+    ]
+    console.print("\n".join(lines))
 
     if stats["operations_by_type"]:
         console.print()
         print_header("Operations by Type:")
-        for op_type, count in stats["operations_by_type"].items():
-            console.print(f"  {op_type}: {count}")
+        console.print(
+            "\n".join(
+                f"  {op_type}: {count}"
+                for op_type, count in stats["operations_by_type"].items()
+            )
+        )
 
 
 def print_history(records: list[Any]) -> None:
@@ -194,24 +235,44 @@ def print_history(records: list[Any]) -> None:
         print_warning("No backup records found")
         return
 
+    if not _IS_TTY:
+        sys.stdout.write(
+            "".join(
+                "{}\t{}\t{}\t{}\t{}\n".format(
+                    record.created_at.isoformat() if record.created_at else "",
+                    record.operation,
+                    record.provider,
+                    record.file_path,
+                    record.status,
+                )
+                for record in records
+            )
+        )
+        return
+
     print_header("Recent Backup Records")
     console.print()
 
-    # Show last 20 records
-    for record in records[:20]:
+    # Precompute all record blocks and render with a single print; basename
+    # avoids allocating a Path object per row
+    blocks = []
+    for record in records:
         status_color = "green" if record.status == "success" else "red"
         status_icon = "✓" if record.status == "success" else "✗"
-
-        console.print(
-            f"[cyan]{record.created_at.strftime('%Y-%m-%d %H:%M:%S') if record.created_at else 'Unknown'}[/cyan]"
+        timestamp = (
+            record.created_at.strftime("%Y-%m-%d %H:%M:%S")
+            if record.created_at
+            else "Unknown"
         )
-        console.print(f"  [magenta]Operation:[/magenta] {record.operation}")
-        console.print(f"  [green]Provider:[/green] {record.provider}")
-        console.print(f"  [yellow]File:[/yellow] {Path(record.file_path).name}")
-        console.print(
-            f"  [{status_color}]Status:[/{status_color}] [{status_color}]{status_icon} {record.status}[/{status_color}]"
+        blocks.append(
+            f"[cyan]{timestamp}[/cyan]\n"
+            f"  [magenta]Operation:[/magenta] {record.operation}\n"
+            f"  [green]Provider:[/green] {record.provider}\n"
+            f"  [yellow]File:[/yellow] {os.path.basename(record.file_path)}\n"
+            f"  [{status_color}]Status:[/{status_color}] [{status_color}]{status_icon} {record.status}[/{status_color}]\n"
         )
-        console.print()
+
+    console.print("\n".join(blocks))
 
 
 def print_duplicates(duplicates: dict[str, list[str]]) -> None:
@@ -220,11 +281,19 @@ def print_duplicates(duplicates: dict[str, list[str]]) -> None:
         print_success("No duplicate files found")
         return
 
+    if not _IS_TTY:
+        sys.stdout.write(
+            "".join(
+                f"{file_hash}\t{','.join(files)}\n"
+                for file_hash, files in duplicates.items()
+            )
+        )
+        return
+
     print_header("Duplicate Files")
     console.print()
 
-    # Show first 10 duplicates
-    for file_hash, files in list(duplicates.items())[:10]:
+    for file_hash, files in duplicates.items():
         console.print(f"[cyan]Hash:[/cyan] {file_hash[:8]}...")
         for file_path in files:
             console.print(f"  [yellow]→[/yellow] {Path(file_path).name}")
@@ -1,15 +1,92 @@
 import concurrent.futures
+import os
+import queue
+import random
+import shutil
+import struct
+import threading
+import time
 from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 from rich.console import Console
 
-from ..providers.base import BaseProvider, ImageInfo
+# Imported once here instead of per probed file; PIL stays optional
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from ..providers.base import BaseProvider, ImageInfo, ProviderPermanentError
 from ..utils.file_utils import FileUtils
 from ..utils.metadata import MetadataManager
 
+# Rough per-image size used only for the disk-space preflight; hosted
+# images rarely average above a few megabytes
+_AVG_IMAGE_BYTES = 2 * 1024 * 1024
+
+
+def _parse_image_header(head: bytes) -> tuple[int, int, str] | None:
+    """Parse image dimensions and format from leading file bytes.
+
+    Covers the common formats whose size lives in the first few KB
+    (PNG, GIF, JPEG, WebP) without invoking PIL at all.
+
+    Parameters
+    ----------
+    head : bytes
+        Leading bytes of the file.
+
+    Returns
+    -------
+    tuple[int, int, str] or None
+        (width, height, format), or None if the header is not
+        recognized.
+    """
+    if head.startswith(b"\x89PNG\r\n\x1a\n") and len(head) >= 24:
+        width, height = struct.unpack(">II", head[16:24])
+        return width, height, "PNG"
+
+    if head[:6] in (b"GIF87a", b"GIF89a") and len(head) >= 10:
+        width, height = struct.unpack("<HH", head[6:10])
+        return width, height, "GIF"
+
+    if head.startswith(b"\xff\xd8"):
+        # Walk JPEG segments to the first start-of-frame marker
+        i = 2
+        n = len(head)
+        while i + 9 < n:
+            if head[i] != 0xFF:
+                i += 1
+                continue
+            marker = head[i + 1]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack(">HH", head[i + 5 : i + 9])
+                return width, height, "JPEG"
+            if marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7:
+                i += 2
+                continue
+            i += 2 + int.from_bytes(head[i + 2 : i + 4], "big")
+        return None
+
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP" and len(head) >= 30:
+        chunk = head[12:16]
+        if chunk == b"VP8 ":
+            width, height = struct.unpack("<HH", head[26:30])
+            return width & 0x3FFF, height & 0x3FFF, "WEBP"
+        if chunk == b"VP8L":
+            bits = int.from_bytes(head[21:25], "little")
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1, "WEBP"
+        if chunk == b"VP8X":
+            width = int.from_bytes(head[24:27], "little") + 1
+            height = int.from_bytes(head[27:30], "little") + 1
+            return width, height, "WEBP"
+
+    return None
+
 
 @dataclass
 class BackupResult:
@@ -36,6 +113,35 @@ class BackupResult:
     provider_name: str
 
 
+@dataclass(slots=True)
+class _DownloadResult:
+    """Outcome of one download attempt, produced in the worker thread.
+
+    Hash, size and header bytes are computed by the worker right after
+    a successful transfer, so the collection loop records metadata
+    without touching the file again.
+
+    Parameters
+    ----------
+    ok : bool
+        Whether the download succeeded.
+    error : str, optional
+        Last error message when the download failed.
+    file_hash : str
+        SHA256 hex digest of the downloaded file.
+    file_size : int
+        Size of the downloaded file in bytes.
+    head : bytes
+        Leading bytes of the file for image-header probing.
+    """
+
+    ok: bool
+    error: str | None = None
+    file_hash: str = ""
+    file_size: int = 0
+    head: bytes = b""
+
+
 class BackupExecutor:
     """Backup executor for Host Image Backup.
 
@@ -64,6 +170,9 @@ class BackupExecutor:
         self._metadata_manager = metadata_manager
         self._console = Console()
         self._logger = logger
+        # Probe results keyed by file hash, so re-downloaded duplicates
+        # skip header parsing entirely
+        self._probe_cache: dict[str, tuple[int | None, int | None, str | None]] = {}
 
     def backup_images(
         self,
@@ -72,6 +181,7 @@ class BackupExecutor:
         limit: int | None = None,
         skip_existing: bool = True,
         verbose: bool = False,
+        show_progress: bool = True,
     ) -> BackupResult:
         """Execute backup operation for a provider.
 
@@ -87,6 +197,10 @@ class BackupExecutor:
             Skip files that already exist.
         verbose : bool, default=False
             Enable verbose logging.
+        show_progress : bool, default=True
+            Render the live progress bar and summary panel. Disabled
+            when several backups run concurrently on one terminal, so
+            their Rich output does not interleave.
 
         Returns
         -------
@@ -113,6 +227,36 @@ class BackupExecutor:
             if limit and total_count:
                 total_count = min(total_count, limit)
 
+            # One readdir up front replaces a stat syscall per remote
+            # image when checking for already-downloaded files
+            existing = (
+                {entry.name for entry in os.scandir(provider_dir)}
+                if skip_existing
+                else set()
+            )
+
+            # Warn before the first download when the target disk
+            # looks too small for what remains. Files already present
+            # will be skipped, so they are excluded from the estimate;
+            # since the per-image size is only a heuristic this warns
+            # loudly instead of aborting a possibly-valid backup
+            if total_count:
+                pending_count = max(total_count - len(existing), 0)
+                free = shutil.disk_usage(provider_dir).free
+                estimated = pending_count * _AVG_IMAGE_BYTES
+                if estimated > free * 0.9:
+                    message = (
+                        f"Disk space may be insufficient: about "
+                        f"{FileUtils.format_file_size(estimated)} estimated for "
+                        f"{pending_count} pending images, "
+                        f"{FileUtils.format_file_size(free)} free at "
+                        f"{provider_dir}"
+                    )
+                    self._logger.warning(message)
+                    self._console.print(
+                        f"[bold yellow]Warning:[/bold yellow] {message}"
+                    )
+
             # If we couldn't get the count, set it to None for indefinite progress bar
             if total_count == 0:
                 total_count = None
@@ -122,81 +266,188 @@ class BackupExecutor:
             error_count = 0
             skip_count = 0
 
+            # Coalesce per-file metadata writes into batched commits
+            self._metadata_manager.begin_batch()
+
             # Execute backup with progress tracking
-            with self._create_progress_bar() as progress:
+            with self._create_progress_bar(disable=not show_progress) as progress:
                 backup_task = progress.add_task(
                     f"Backing up {provider_name}",
                     total=total_count,
                 )
 
                 # Process images concurrently
-                with concurrent.futures.ThreadPoolExecutor(
-                    max_workers=self._config_manager.config.max_concurrent_downloads
-                ) as executor:
-                    # Submit download tasks
-                    download_tasks = []
-                    for image_info in provider.list_images(limit=limit):
-                        output_file = provider_dir / FileUtils.sanitize_filename(
-                            image_info.filename
-                        )
-
-                        # Skip if file exists and skip_existing is True
-                        if skip_existing and output_file.exists():
-                            skip_count += 1
-                            self._record_skipped_backup(
-                                provider_name, output_file, image_info
-                            )
-                            progress.update(backup_task, advance=1)
-                            if verbose:
-                                self._console.print(
-                                    f"[yellow]Skipping existing file: {image_info.filename}[/yellow]"
-                                )
-                            continue
-
-                        # Submit download task
-                        future = executor.submit(
-                            self._download_image_with_retry,
-                            provider,
-                            image_info,
-                            output_file,
-                            verbose,
-                        )
-                        download_tasks.append((future, image_info, output_file))
-
-                    # Process completed downloads
-                    for future, image_info, output_file in download_tasks:
-                        try:
-                            result = future.result()
-                            if result:
-                                success_count += 1
-                                self._record_successful_backup(
-                                    provider_name, output_file, image_info
-                                )
-                            else:
-                                error_count += 1
-                                self._record_failed_backup(
+                max_workers = self._config_manager.config.max_concurrent_downloads
+                with (
+                    concurrent.futures.ThreadPoolExecutor(
+                        max_workers=max_workers
+                    ) as executor,
+                    concurrent.futures.ThreadPoolExecutor(
+                        max_workers=min(4, os.cpu_count() or 1),
+                        thread_name_prefix="probe",
+                    ) as meta_executor,
+                ):
+                    download_tasks = {}
+                    meta_futures = []
+                    # Cap in-flight futures so listing a huge provider
+                    # does not queue every download up front
+                    max_pending = max_workers * 4
+
+                    # Coalesce progress advances: one Rich redraw per 32
+                    # completions instead of one per file
+                    pending_advance = 0
+
+                    def advance_progress(force=False):
+                        nonlocal pending_advance
+                        pending_advance += 0 if force else 1
+                        if pending_advance >= 32 or (force and pending_advance):
+                            progress.update(backup_task, advance=pending_advance)
+                            pending_advance = 0
+
+                    def handle_result(future):
+                        nonlocal success_count, error_count
+                        image_info, output_file = download_tasks.pop(future)
+                        # The worker reports failures as data, so no
+                        # traceback is built or unwound per failed file
+                        result = future.result()
+                        if result.ok:
+                            success_count += 1
+                            # Probing can decode via PIL; push it to the
+                            # probe pool so the next future.result() is
+                            # not blocked behind image decoding
+                            meta_futures.append(
+                                meta_executor.submit(
+                                    self._record_successful_backup,
                                     provider_name,
                                     output_file,
                                     image_info,
-                                    "Download failed",
+                                    result,
                                 )
-                        except Exception as e:
+                            )
+                        else:
                             error_count += 1
                             self._record_failed_backup(
                                 provider_name,
                                 output_file,
                                 image_info,
-                                f"Download exception: {str(e)}",
+                                result.error or "Download failed",
                             )
-                            if verbose:
-                                self._logger.error(f"Download task error: {e}")
 
-                        progress.update(backup_task, advance=1)
+                        advance_progress()
 
-            # Show backup summary
-            self._show_backup_summary(
-                provider_name, success_count, error_count, skip_count
-            )
+                    # Run the listing in a producer thread feeding a
+                    # bounded queue, so slow pagination requests overlap
+                    # with downloads instead of gating them
+                    items: queue.Queue = queue.Queue(maxsize=max_pending)
+                    done_sentinel = object()
+                    listing_error: list[Exception] = []
+
+                    def produce_listing():
+                        try:
+                            for info in provider.list_images(limit=limit):
+                                items.put(info)
+                        except Exception as e:
+                            listing_error.append(e)
+                        finally:
+                            items.put(done_sentinel)
+
+                    producer = threading.Thread(
+                        target=produce_listing,
+                        name="backup-listing",
+                        daemon=True,
+                    )
+                    producer.start()
+
+                    # Bail fast on error or Ctrl-C: cancel queued
+                    # downloads instead of letting the pool shutdown
+                    # finish work whose results would be discarded
+                    def cancel_pending():
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        meta_executor.shutdown(wait=False, cancel_futures=True)
+
+                    # Bind per-iteration lookups to locals; small, but
+                    # the loop body runs once per remote image
+                    get_item = items.get
+                    sanitize = FileUtils.sanitize_filename
+                    record_skipped = self._record_skipped_backup
+                    submit = executor.submit
+                    download_with_retry = self._download_image_with_retry
+                    futures_wait = concurrent.futures.wait
+
+                    try:
+                        # Submit download tasks
+                        while True:
+                            image_info = get_item()
+                            if image_info is done_sentinel:
+                                break
+
+                            sanitized_name = sanitize(image_info.filename)
+                            output_file = provider_dir / sanitized_name
+
+                            # Skip if file exists and skip_existing is True
+                            if skip_existing and sanitized_name in existing:
+                                skip_count += 1
+                                record_skipped(provider_name, output_file, image_info)
+                                advance_progress()
+                                if verbose:
+                                    # logger, not Console: per-file output in
+                                    # the hot loop must not pay for markup
+                                    # rendering and the console lock
+                                    self._logger.debug(
+                                        f"Skipping existing file: {image_info.filename}"
+                                    )
+                                continue
+
+                            # Apply back-pressure before submitting more:
+                            # wait for at least one download to finish once
+                            # the in-flight window is full
+                            if len(download_tasks) >= max_pending:
+                                done, _ = futures_wait(
+                                    download_tasks,
+                                    return_when=concurrent.futures.FIRST_COMPLETED,
+                                )
+                                for future in done:
+                                    handle_result(future)
+
+                            # Submit download task
+                            future = submit(
+                                download_with_retry,
+                                provider,
+                                image_info,
+                                output_file,
+                                verbose,
+                            )
+                            download_tasks[future] = (image_info, output_file)
+
+                        # Process remaining downloads as they complete, so
+                        # one slow transfer does not hold back progress and
+                        # metadata recording for everything after it
+                        for future in concurrent.futures.as_completed(
+                            list(download_tasks)
+                        ):
+                            handle_result(future)
+
+                        # Let outstanding probe/record work settle before
+                        # the batch flush (errors are handled inside)
+                        concurrent.futures.wait(meta_futures)
+
+                        advance_progress(force=True)
+
+                        producer.join()
+                        if listing_error:
+                            raise listing_error[0]
+                    except BaseException:
+                        # Bail fast: a listing error or Ctrl-C should
+                        # not wait for every queued download to run
+                        cancel_pending()
+                        raise
+
+            # Show backup summary (suppressed alongside the progress
+            # bar; parallel callers report results from the main thread)
+            if show_progress:
+                self._show_backup_summary(
+                    provider_name, success_count, error_count, skip_count
+                )
 
             return BackupResult(
                 success_count=success_count,
@@ -209,6 +460,8 @@ class BackupExecutor:
         except Exception as e:
             self._logger.error(f"Backup process error: {e}")
             raise
+        finally:
+            self._metadata_manager.flush_batch()
 
     def _download_image_with_retry(
         self,
@@ -216,9 +469,14 @@ class BackupExecutor:
         image_info: ImageInfo,
         output_file: Path,
         verbose: bool,
-    ) -> bool:
+    ) -> _DownloadResult:
         """Download image with retry logic.
 
+        Never raises: failures are returned as data so the collection
+        loop does not pay for exception unwinding per failed file. On
+        success the file is hashed here in the worker, overlapping that
+        read with other transfers.
+
         Parameters
         ----------
         provider : BaseProvider
@@ -232,32 +490,65 @@ class BackupExecutor:
 
         Returns
         -------
-        bool
-            True if download successful, False otherwise.
+        _DownloadResult
+            Download outcome with hash, size and header bytes on success.
         """
         config = self._config_manager.config
+        error: str | None = None
+        backoff_base = config.retry_backoff_base
+        backoff_cap = config.retry_backoff_cap
 
         for attempt in range(config.retry_count + 1):
+            # Exponential backoff with jitter before each retry, so a
+            # transient 5xx/429 is not immediately hammered again
+            if attempt and backoff_base:
+                time.sleep(
+                    min(
+                        backoff_cap,
+                        backoff_base * (2 ** (attempt - 1))
+                        + random.random() * backoff_base,
+                    )
+                )
             try:
                 result = provider.download_image(image_info, output_file)
                 if result:
                     if verbose:
-                        self._console.print(
-                            f"[green]Download successful: {image_info.filename}[/green]"
+                        self._logger.debug(
+                            f"Download successful: {image_info.filename}"
                         )
-                    return True
+                    try:
+                        file_hash, file_size, head = self._hash_file(output_file)
+                    except OSError:
+                        file_hash, file_size, head = "", 0, b""
+                    return _DownloadResult(
+                        ok=True,
+                        file_hash=file_hash,
+                        file_size=file_size,
+                        head=head,
+                    )
                 else:
+                    error = "Download failed"
                     if verbose:
-                        self._console.print(
-                            f"[red]Download failed: {image_info.filename} (attempt {attempt + 1}/{config.retry_count + 1})[/red]"
+                        self._logger.debug(
+                            f"Download failed: {image_info.filename} (attempt {attempt + 1}/{config.retry_count + 1})"
                         )
+            except ProviderPermanentError as e:
+                # Retrying a 404 or auth failure cannot succeed; stop
+                # here and save the remaining attempts
+                error = f"Download failed permanently: {e}"
+                if verbose:
+                    self._logger.debug(
+                        f"Download failed permanently: {image_info.filename}: {e}"
+                    )
+                break
             except Exception as e:
+                error = f"Download exception: {e}"
                 if verbose:
-                    self._console.print(
-                        f"[red]Download exception: {image_info.filename} (attempt {attempt + 1}/{config.retry_count + 1}): {e}[/red]"
+                    self._logger.debug(
+                        f"Download exception: {image_info.filename} (attempt {attempt + 1}/{config.retry_count + 1}): {e}"
                     )
 
-        return False
+        return _DownloadResult(ok=False, error=error)
 
     def _record_skipped_backup(
         self, provider_name: str, output_file: Path, image_info: ImageInfo
@@ -285,7 +576,11 @@ class BackupExecutor:
         )
 
     def _record_successful_backup(
-        self, provider_name: str, output_file: Path, image_info: ImageInfo
+        self,
+        provider_name: str,
+        output_file: Path,
+        image_info: ImageInfo,
+        result: _DownloadResult,
     ) -> None:
         """Record successful backup operation in metadata.
 
@@ -297,32 +592,31 @@ class BackupExecutor:
             Output file path.
         image_info : ImageInfo
             Image information.
+        result : _DownloadResult
+            Download outcome carrying the hash, size and header bytes
+            computed in the worker, so the file is not read again here.
         """
         try:
-            file_hash = (
-                FileUtils.calculate_file_hash(output_file)
-                if output_file.exists()
-                else ""
-            )
-            file_size = (
-                FileUtils.get_file_size(output_file) if output_file.exists() else 0
-            )
-
             # Record backup operation
             self._metadata_manager.record_backup(
                 operation="download",
                 provider=provider_name,
                 file_path=output_file,
                 remote_path=image_info.url or image_info.filename,
-                file_hash=file_hash,
-                file_size=file_size,
+                file_hash=result.file_hash,
+                file_size=result.file_size,
                 status="success",
                 message="Download completed successfully",
             )
 
             # Update image metadata
-            if output_file.exists():
-                self._update_image_metadata(output_file, file_hash, file_size)
+            if result.file_hash:
+                self._update_image_metadata(
+                    output_file, result.file_hash, result.file_size, result.head
+                )
+                # Seed the hash caches so a later upload or re-run of
+                # this file never reads it again just to hash it
+                self._metadata_manager.prime_file_hash(output_file, result.file_hash)
 
         except Exception as e:
             self._logger.warning(
@@ -356,8 +650,34 @@ class BackupExecutor:
             message=message,
         )
 
+    def _hash_file(self, output_file: Path) -> tuple[str, int, bytes]:
+        """Hash a downloaded file in one buffered pass.
+
+        Parameters
+        ----------
+        output_file : Path
+            Output file path.
+
+        Returns
+        -------
+        tuple[str, int, bytes]
+            Hex digest (the metadata database's pinned algorithm), byte
+            count, and the first 64 KiB of the file (enough for
+            image-header probing without a re-read).
+        """
+        hasher = self._metadata_manager.new_hash()
+        size = 0
+        head = b""
+        with open(output_file, "rb") as f:
+            while chunk := f.read(1 << 20):
+                if not head:
+                    head = chunk[:65536]
+                hasher.update(chunk)
+                size += len(chunk)
+        return hasher.hexdigest(), size, head
+
     def _update_image_metadata(
-        self, output_file: Path, file_hash: str, file_size: int
+        self, output_file: Path, file_hash: str, file_size: int, head: bytes = b""
     ) -> None:
         """Update image metadata with dimensions and format.
 
@@ -369,22 +689,20 @@ class BackupExecutor:
             File hash.
         file_size : int
             File size.
+        head : bytes, optional
+            Leading bytes of the file; image dimensions are parsed from
+            these when provided, avoiding another disk read.
         """
         try:
-            # Try to get image dimensions
-            width = None
-            height = None
-            format = None
-
-            try:
-                from PIL import Image
-
-                with Image.open(output_file) as img:
-                    width, height = img.size
-                    format = img.format
-            except Exception:
-                # PIL not available or image processing failed
-                pass
+            # Try to get image dimensions: memoized by hash, then a
+            # pure-Python header parse, then PIL as a last resort
+            probe = self._probe_cache.get(file_hash)
+            if probe is None:
+                probe = _parse_image_header(head) if head else None
+                if probe is None:
+                    probe = self._probe_with_pil(output_file, head)
+                self._probe_cache[file_hash] = probe
+            width, height, format = probe
 
             # Update metadata
             self._metadata_manager.update_file_metadata(
@@ -400,9 +718,49 @@ class BackupExecutor:
                 f"Failed to update image metadata for {output_file}: {e}"
             )
 
-    def _create_progress_bar(self):
+    def _probe_with_pil(
+        self, output_file: Path, head: bytes
+    ) -> tuple[int | None, int | None, str | None]:
+        """Probe image dimensions and format via PIL.
+
+        Parameters
+        ----------
+        output_file : Path
+            Output file path.
+        head : bytes
+            Leading bytes of the file, tried before the file on disk.
+
+        Returns
+        -------
+        tuple
+            (width, height, format); all None when PIL is unavailable
+            or the image cannot be parsed.
+        """
+        if Image is None:
+            return None, None, None
+        try:
+            try:
+                with Image.open(BytesIO(head) if head else output_file) as img:
+                    return img.size[0], img.size[1], img.format
+            except Exception:
+                if head:
+                    # Header alone was not enough for this format;
+                    # fall back to the file on disk
+                    with Image.open(output_file) as img:
+                        return img.size[0], img.size[1], img.format
+                raise
+        except Exception:
+            # Image processing failed
+            return None, None, None
+
+    def _create_progress_bar(self, disable: bool = False):
         """Create progress bar with consistent styling.
 
+        Parameters
+        ----------
+        disable : bool, default=False
+            Render nothing (concurrent backups share one terminal).
+
         Returns
         -------
         Progress
@@ -410,7 +768,7 @@ class BackupExecutor:
         """
         from ..config.styles import create_backup_progress_bar
 
-        return create_backup_progress_bar()
+        return create_backup_progress_bar(disable=disable)
 
     def _show_backup_summary(
         self, provider_name: str, success: int, error: int, skip: int
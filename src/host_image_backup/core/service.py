@@ -48,7 +48,7 @@ class BackupService:
             self._provider_manager, self._config_manager, self._metadata_manager
         )
         self._upload_service = UploadService(
-            self._provider_manager, self._metadata_manager
+            self._provider_manager, self._metadata_manager, self._config_manager
         )
         self._compression_service = CompressionService(self._config_manager)
 
@@ -62,6 +62,18 @@ class BackupService:
         """Get metadata manager."""
         return self._metadata_manager
 
+    def clear_listing_cache(self, provider_name: str) -> None:
+        """Clear a provider's locally cached listing data.
+
+        Parameters
+        ----------
+        provider_name : str
+            Name of the provider.
+        """
+        provider = self._provider_manager.get_provider(provider_name)
+        if provider:
+            provider.clear_listing_cache()
+
     def backup_images(
         self,
         provider_name: str,
@@ -69,6 +81,7 @@ class BackupService:
         limit: int | None = None,
         skip_existing: bool = True,
         verbose: bool = False,
+        show_progress: bool = True,
     ) -> bool:
         """Execute backup operation for a provider.
 
@@ -84,6 +97,9 @@ class BackupService:
             Skip files that already exist.
         verbose : bool, default=False
             Enable verbose logging.
+        show_progress : bool, default=True
+            Render the live progress bar and summary panel; disabled
+            by parallel callers sharing one terminal.
 
         Returns
         -------
@@ -104,6 +120,7 @@ class BackupService:
                 limit=limit,
                 skip_existing=skip_existing,
                 verbose=verbose,
+                show_progress=show_progress,
             )
 
             return result.error_count == 0
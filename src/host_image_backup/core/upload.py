@@ -4,13 +4,13 @@ This module handles upload operations including single file upload
 and batch upload with progress tracking.
 """
 
+import concurrent.futures
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 from rich.console import Console
-from rich.panel import Panel
 
 from ..utils.file_utils import FileUtils
 from ..utils.metadata import MetadataManager
@@ -50,12 +50,20 @@ class UploadService:
         Provider manager instance.
     metadata_manager : MetadataManager
         Metadata manager instance.
+    config_manager : Any, optional
+        Configuration manager instance; sizes the batch upload pool.
     """
 
-    def __init__(self, provider_manager: Any, metadata_manager: MetadataManager):
+    def __init__(
+        self,
+        provider_manager: Any,
+        metadata_manager: MetadataManager,
+        config_manager: Any = None,
+    ):
         """Initialize upload service."""
         self._provider_manager = provider_manager
         self._metadata_manager = metadata_manager
+        self._config_manager = config_manager
         self._console = Console()
         self._logger = logger
 
@@ -95,11 +103,15 @@ class UploadService:
                 self._console.print(f"[red]File not found: {file_path}[/red]")
                 return False
 
-            # Calculate file hash and size
-            file_hash = FileUtils.calculate_file_hash(file_path)
+            # Calculate file hash and size (hash served from the
+            # metadata cache when the file was seen before)
+            file_hash = self._metadata_manager.get_file_hash(file_path)
             file_size = FileUtils.get_file_size(file_path)
 
-            # Show upload start message
+            # Show upload start message (Panel imported here so the error
+            # paths above never touch it)
+            from rich.panel import Panel
+
             self._console.print(
                 Panel(
                     f"[cyan]Uploading {file_path.name} to {provider_name}[/cyan]\n"
@@ -174,6 +186,8 @@ class UploadService:
         error_count = 0
 
         # Show batch upload start message
+        from rich.panel import Panel
+
         self._console.print(
             Panel(
                 f"[cyan]Starting batch upload to {provider_name}[/cyan]\n"
@@ -183,6 +197,12 @@ class UploadService:
             )
         )
 
+        # Uploads are network-bound, so run them in a thread pool and
+        # count results as they complete
+        max_workers = 4
+        if self._config_manager is not None:
+            max_workers = self._config_manager.config.max_concurrent_downloads or 4
+
         # Create progress bar
         with self._create_progress_bar() as progress:
             upload_task = progress.add_task(
@@ -190,27 +210,49 @@ class UploadService:
                 total=total_files,
             )
 
-            # Process each file
+            # Resolve remote paths and file sizes up front: one branch
+            # on the prefix and one stat per file here, instead of a
+            # per-file check plus extra exists/stat calls in the workers
+            if remote_prefix:
+                remote_paths = [f"{remote_prefix}{fp.name}" for fp in file_paths]
+            else:
+                remote_paths = [None] * total_files
+            file_sizes = []
             for file_path in file_paths:
                 try:
-                    # Determine remote path
-                    remote_path = None
-                    if remote_prefix:
-                        remote_path = f"{remote_prefix}{file_path.name}"
-
-                    # Upload single file
-                    if self.upload_image(
-                        provider_name, file_path, remote_path, verbose
-                    ):
-                        success_count += 1
-                    else:
+                    file_sizes.append(file_path.stat().st_size)
+                except OSError:
+                    file_sizes.append(-1)
+
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        self._upload_one,
+                        provider,
+                        provider_name,
+                        file_path,
+                        remote_path,
+                        file_size,
+                    ): file_path
+                    for file_path, remote_path, file_size in zip(
+                        file_paths, remote_paths, file_sizes, strict=True
+                    )
+                }
+
+                for future in concurrent.futures.as_completed(futures):
+                    file_path = futures[future]
+                    try:
+                        if future.result():
+                            success_count += 1
+                        else:
+                            error_count += 1
+                    except Exception as e:
                         error_count += 1
+                        self._logger.error(f"Batch upload error for {file_path}: {e}")
 
-                except Exception as e:
-                    error_count += 1
-                    self._logger.error(f"Batch upload error for {file_path}: {e}")
-
-                progress.update(upload_task, advance=1)
+                    progress.update(upload_task, advance=1)
 
         # Show summary
         self._console.print()
@@ -225,6 +267,65 @@ class UploadService:
             provider_name=provider_name,
         )
 
+    def _upload_one(
+        self,
+        provider: Any,
+        provider_name: str,
+        file_path: Path,
+        remote_path: str | None,
+        file_size: int,
+    ) -> bool:
+        """Upload a single file without console output.
+
+        Worker used by ``upload_batch``: per-file status goes to the
+        logger only, so concurrent workers do not contend on Rich
+        rendering; the caller owns the progress bar and summary.
+
+        Parameters
+        ----------
+        provider : Any
+            Provider instance.
+        provider_name : str
+            Provider name.
+        file_path : Path
+            Local file path to upload.
+        remote_path : str, optional
+            Remote path for the file.
+        file_size : int
+            Pre-fetched file size in bytes; negative when the file was
+            missing at batch start.
+
+        Returns
+        -------
+        bool
+            True if upload successful, False otherwise.
+        """
+        try:
+            if file_size < 0:
+                self._logger.error(f"File not found: {file_path}")
+                return False
+
+            file_hash = self._metadata_manager.get_file_hash(file_path)
+
+            result = provider.upload_image(file_path, remote_path)
+
+            if result.success:
+                self._record_successful_upload(
+                    provider_name, file_path, remote_path, file_hash, file_size, result
+                )
+                self._logger.debug(f"Upload successful: {file_path.name}")
+                return True
+
+            self._record_failed_upload(
+                provider_name, file_path, remote_path, file_hash, file_size, result
+            )
+            self._logger.error(f"Upload failed for {file_path.name}: {result.message}")
+            return False
+
+        except Exception as e:
+            self._logger.error(f"Upload process error for {file_path}: {e}")
+            return False
+
     def validate_upload_requirements(
         self, provider_name: str, file_paths: list[Path]
     ) -> bool:
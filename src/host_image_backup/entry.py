@@ -0,0 +1,53 @@
+"""Lightweight console-script entry point.
+
+Handles ``--help``/``--version``/no-args directly from ``sys.argv`` before
+typer (and its click/rich import graph) is loaded, so the trivial paths of
+``hib`` stay fast. Real subcommands fall through to the typer app.
+"""
+
+import sys
+
+# Static summary kept in sync with the typer app in cli.py. Shown only for
+# the bare --help/no-args fast path; full per-command help still goes
+# through typer.
+_STATIC_HELP = """\
+Usage: hib [OPTIONS] COMMAND [ARGS]...
+
+Options:
+  -c, --config PATH  Configuration file path
+                     [default: ~/.config/host-image-backup/config.yaml]
+  -v, --verbose      Show detailed logs
+  --version          Show version and exit
+  -h, --help         Show this message and exit
+
+Commands:
+  config      Configuration management commands
+  provider    Provider management commands
+  backup      Backup management commands
+  backup-all  Backup images from all enabled providers
+  upload      Upload management commands
+  data        Data management commands
+"""
+
+
+def main() -> None:
+    """Dispatch to the typer app, short-circuiting trivial invocations."""
+    args = sys.argv[1:]
+
+    if not args or args[0] in ("-h", "--help"):
+        sys.stdout.write(_STATIC_HELP)
+        sys.exit(0)
+
+    if args[0] == "--version":
+        from . import __version__
+
+        sys.stdout.write(f"host-image-backup {__version__}\n")
+        sys.exit(0)
+
+    from .cli import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
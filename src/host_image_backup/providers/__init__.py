@@ -1,19 +1,33 @@
+from importlib import import_module
+
 from .base import (
     SUPPORTED_IMAGE_EXTENSIONS,
     BaseProvider,
     ImageInfo,
+    ProviderError,
+    ProviderPermanentError,
+    ProviderTransientError,
     SingleUploadResult,
 )
-from .cos import COSProvider
-from .github import GitHubProvider
-from .imgur import ImgurProvider
-from .oss import OSSProvider
 from .provider_manager import ProviderManager
-from .sms import SMSProvider
+
+# Provider classes are imported lazily (PEP 562) so that importing this
+# package does not pull in every provider SDK; ProviderManager resolves
+# the class it needs on first use.
+_LAZY_PROVIDERS = {
+    "OSSProvider": ".oss",
+    "COSProvider": ".cos",
+    "SMSProvider": ".sms",
+    "ImgurProvider": ".imgur",
+    "GitHubProvider": ".github",
+}
 
 __all__ = [
     "BaseProvider",
     "ImageInfo",
+    "ProviderError",
+    "ProviderPermanentError",
+    "ProviderTransientError",
     "SingleUploadResult",
     "SUPPORTED_IMAGE_EXTENSIONS",
     "OSSProvider",
@@ -23,3 +37,10 @@ __all__ = [
     "GitHubProvider",
     "ProviderManager",
 ]
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_PROVIDERS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_path, __name__), name)
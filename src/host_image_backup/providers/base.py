@@ -1,5 +1,7 @@
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -22,10 +24,30 @@ SUPPORTED_IMAGE_EXTENSIONS = {
 }
 
 
-@dataclass
+class ProviderError(Exception):
+    """Base class for provider operation errors"""
+
+
+class ProviderTransientError(ProviderError):
+    """Error that may succeed on retry (timeouts, 5xx, rate limits)"""
+
+
+class ProviderPermanentError(ProviderError):
+    """Error that will not succeed on retry (404, auth failures)
+
+    The retry loop stops immediately for these, saving the remaining
+    attempts on broken links.
+    """
+
+
+@dataclass(slots=True)
 class ImageInfo:
     """Image information
 
+    Slotted because listing yields one instance per remote object;
+    dropping the per-instance ``__dict__`` keeps large enumerations
+    cheap.
+
     Parameters
     ----------
     url : str
@@ -34,8 +56,9 @@ class ImageInfo:
         The filename of the image.
     size : int, optional
         The size of the image in bytes.
-    created_at : str, optional
-        The creation timestamp of the image.
+    created_at : datetime or str, optional
+        The creation timestamp of the image. Providers may store the
+        raw datetime; callers format it on access.
     tags : list of str, optional
         Tags associated with the image.
     metadata : dict, optional
@@ -45,7 +68,7 @@ class ImageInfo:
     url: str
     filename: str
     size: int | None = None
-    created_at: str | None = None
+    created_at: datetime | str | None = None
     tags: list[str] | None = None
     metadata: dict[str, Any] | None = None
 
@@ -106,6 +129,10 @@ class BaseProvider(ABC):
     This is the base class that all provider implementations should inherit from.
     """
 
+    # How long a connection test result stays valid; several call sites
+    # (provider info rendering, validation) probe reachability back to back
+    _CONN_CACHE_TTL = 5.0
+
     def __init__(self, config: Any):
         """Initialize provider
 
@@ -116,6 +143,7 @@ class BaseProvider(ABC):
         """
         self.config = config
         self.logger = logger
+        self._conn_cache: tuple[float, bool] | None = None
 
     @abstractmethod
     def test_connection(self) -> bool:
@@ -183,6 +211,67 @@ class BaseProvider(ABC):
         """
         pass
 
+    def download_images_batch(
+        self,
+        image_infos: Iterable[ImageInfo],
+        output_dir: Path,
+        max_workers: int = 16,
+    ) -> list[bool]:
+        """Download several images concurrently
+
+        Each download is an independent blocking network transfer, so a
+        thread pool overlaps their latency; the pool size also acts as
+        the per-provider concurrency cap against rate limits.
+
+        Parameters
+        ----------
+        image_infos : Iterable[ImageInfo]
+            Images to download.
+        output_dir : Path
+            Directory to save the images in, named by their filename.
+        max_workers : int, default=16
+            Maximum number of concurrent downloads.
+
+        Returns
+        -------
+        list[bool]
+            Per-image success flags, in input order.
+        """
+        image_infos = list(image_infos)
+        if not image_infos:
+            return []
+
+        output_dir.mkdir(parents=True, exist_ok=True)
+        workers = min(max_workers, len(image_infos))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    lambda info: self.download_image(info, output_dir / info.filename),
+                    image_infos,
+                )
+            )
+
+    def check_connection(self) -> bool:
+        """Test the connection, caching the result for a short TTL
+
+        Avoids repeating a remote round-trip when reachability is probed
+        several times in one command (e.g. rendering provider info).
+
+        Returns
+        -------
+        bool
+            True if connection is successful, False otherwise.
+        """
+        now = time.monotonic()
+        if (
+            self._conn_cache is not None
+            and now - self._conn_cache[0] < self._CONN_CACHE_TTL
+        ):
+            return self._conn_cache[1]
+        result = self.test_connection()
+        self._conn_cache = (now, result)
+        return result
+
     def get_file_info(self, remote_path: str) -> FileInfo | None:
         """Get file information from remote storage
 
@@ -239,6 +328,14 @@ class BaseProvider(ABC):
             self.logger.warning(f"Unable to get image count: {e}")
             return None
 
+    def clear_listing_cache(self) -> None:  # noqa: B027 - optional hook
+        """Drop any locally cached listing state
+
+        Default implementation is a no-op; providers that persist
+        listing data between runs (e.g. SM.MS upload history) override
+        this so ``--refresh`` can force a full re-enumeration.
+        """
+
     def validate_config(self) -> bool:
         """Validate if configuration is valid
 
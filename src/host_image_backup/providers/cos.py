@@ -1,3 +1,4 @@
+import os
 from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
@@ -5,6 +6,8 @@ from pathlib import Path
 import requests
 from loguru import logger
 from qcloud_cos import CosConfig, CosS3Client
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config import COSConfig
 from .base import (
@@ -24,6 +27,7 @@ class COSProvider(BaseProvider):
         self.config: COSConfig = config
         self.logger = logger
         self._client = None
+        self._session: requests.Session | None = None
 
     @property
     def client(self) -> CosS3Client:
@@ -43,6 +47,33 @@ class COSProvider(BaseProvider):
             self._client = CosS3Client(cos_config)
         return self._client
 
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session for public-URL downloads
+
+        Reusing pooled connections avoids a TCP/TLS handshake per file
+        when downloads fall back to the bucket's public URL.
+
+        Returns
+        -------
+        requests.Session
+            The shared session instance.
+        """
+        if self._session is None:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                ),
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+        return self._session
+
     def test_connection(self) -> bool:
         """Test COS connection
 
@@ -154,21 +185,31 @@ class COSProvider(BaseProvider):
             # Get key from metadata
             key = image_info.metadata.get("key") if image_info.metadata else None
 
-            if key:
-                # Download directly from COS
-                response = self.client.get_object(Bucket=self.config.bucket, Key=key)
-
-                with open(output_path, "wb") as f:
-                    for chunk in response["Body"].iter_chunks():
-                        f.write(chunk)
-            else:
-                # Download via URL
-                response = requests.get(image_info.url, timeout=30, stream=True)
-                response.raise_for_status()
-
-                with open(output_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+            # Write to a .part file and publish atomically, so an
+            # interrupted transfer never looks like a complete image
+            tmp = output_path.with_name(output_path.name + ".part")
+            try:
+                if key:
+                    # Download directly from COS
+                    response = self.client.get_object(
+                        Bucket=self.config.bucket, Key=key
+                    )
+
+                    with open(tmp, "wb") as f:
+                        for chunk in response["Body"].iter_chunks():
+                            f.write(chunk)
+                else:
+                    # Download via URL
+                    response = self.session.get(image_info.url, timeout=30, stream=True)
+                    response.raise_for_status()
+
+                    with open(tmp, "wb") as f:
+                        for chunk in response.iter_content(chunk_size=8192):
+                            f.write(chunk)
+                os.replace(tmp, output_path)
+            except Exception:
+                tmp.unlink(missing_ok=True)
+                raise
 
             self.logger.debug(f"Successfully downloaded image: {image_info.filename}")
             return True
@@ -1,12 +1,39 @@
+import json
+import os
+import threading
+import time
+from collections import deque
 from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Any
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config import GitHubConfig
 from .base import SUPPORTED_IMAGE_EXTENSIONS, BaseProvider, ImageInfo
 
+# Hashed once at import time; the listing loops test every file in the
+# repository against this set
+_IMAGE_EXTS = frozenset(SUPPORTED_IMAGE_EXTENSIONS)
+
+# Persisted ETag cache: a 304 revalidation carries no body and does not
+# count against the GitHub rate limit
+_ETAG_CACHE = Path.home() / ".cache" / "host-image-backup" / "github-etags.json"
+
+
+def _file_ext(path: str) -> str:
+    """Lowercased extension of a path string, without building a PurePath.
+
+    The listing loops test every blob in the repository; plain string
+    slicing avoids a PurePath allocation and parse per item.
+    """
+    dot = path.rfind(".")
+    return path[dot:].lower() if dot >= 0 else ""
+
 
 class GitHubProvider(BaseProvider):
     """GitHub Provider"""
@@ -16,6 +43,87 @@ class GitHubProvider(BaseProvider):
         self.config: GitHubConfig = config
         self.logger = logger
         self.api_base = "https://api.github.com"
+        self._count_cache: tuple[float, int] | None = None
+        self._etag_cache: dict[str, list] | None = None
+        # One session for all API and download traffic so TCP/TLS
+        # handshakes amortize across calls; retries with backoff are
+        # handled at the adapter level
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=getattr(config, "retry_count", None) or 3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update(
+            {
+                "Authorization": f"token {config.token}",
+                "Accept": "application/vnd.github.v3+json",
+                "User-Agent": "host-image-backup",
+            }
+        )
+
+    def _load_etag_cache(self) -> dict[str, list]:
+        """Load the persisted {url: [etag, body]} cache (once per instance)."""
+        if self._etag_cache is None:
+            try:
+                with open(_ETAG_CACHE, encoding="utf-8") as f:
+                    self._etag_cache = json.load(f)
+            except FileNotFoundError:
+                self._etag_cache = {}
+            except Exception as e:
+                self.logger.debug(f"Ignoring unusable GitHub ETag cache: {e}")
+                self._etag_cache = {}
+        return self._etag_cache
+
+    def _save_etag_cache(self) -> None:
+        """Persist the ETag cache atomically (best-effort)."""
+        try:
+            _ETAG_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = _ETAG_CACHE.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self._etag_cache, f)
+            os.replace(tmp_file, _ETAG_CACHE)
+        except Exception as e:
+            self.logger.debug(f"Failed to write GitHub ETag cache: {e}")
+
+    def _api_get_json(
+        self, url: str, params: dict | None = None, timeout: int = 30
+    ) -> tuple[int, Any]:
+        """GET an API URL with conditional-request revalidation
+
+        Sends ``If-None-Match`` when an ETag is cached for the URL; a
+        ``304 Not Modified`` answer reuses the cached body at zero body
+        cost and without consuming rate limit.
+
+        Returns
+        -------
+        tuple[int, Any]
+            Effective status code and decoded JSON body (None on
+            non-200 responses).
+        """
+        cache = self._load_etag_cache()
+        key = url if not params else f"{url}?{sorted(params.items())}"
+        entry = cache.get(key)
+        headers = {"If-None-Match": entry[0]} if entry else None
+        response = self._session.get(
+            url, params=params, headers=headers, timeout=timeout
+        )
+        if response.status_code == 304 and entry:
+            return 200, entry[1]
+        if response.status_code == 200:
+            body = response.json()
+            etag = response.headers.get("ETag")
+            if etag:
+                cache[key] = [etag, body]
+                self._save_etag_cache()
+            return 200, body
+        return response.status_code, None
 
     def test_connection(self) -> bool:
         """Test GitHub connection
@@ -26,13 +134,8 @@ class GitHubProvider(BaseProvider):
             True if connection is successful, False otherwise.
         """
         try:
-            headers = {
-                "Authorization": f"token {self.config.token}",
-                "Accept": "application/vnd.github.v3+json",
-            }
-            response = requests.get(
+            response = self._session.get(
                 f"{self.api_base}/repos/{self.config.owner}/{self.config.repo}",
-                headers=headers,
                 timeout=10,
             )
             return response.status_code == 200
@@ -43,6 +146,11 @@ class GitHubProvider(BaseProvider):
     def list_images(self, limit: int | None = None) -> Iterator[ImageInfo]:
         """List all images in GitHub repository
 
+        Fetches the whole repository tree in a single
+        ``/git/trees/{branch}?recursive=1`` request instead of one
+        ``/contents`` round-trip per directory. Falls back to the
+        directory walk when GitHub truncates the tree response.
+
         Parameters
         ----------
         limit : int, optional
@@ -53,75 +161,139 @@ class GitHubProvider(BaseProvider):
         ImageInfo
             Information about each image.
         """
-        headers = {
-            "Authorization": f"token {self.config.token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
+        owner = self.config.owner
+        repo = self.config.repo
         count = 0
-        image_extensions = SUPPORTED_IMAGE_EXTENSIONS
 
-        # Use iterative approach instead of recursion to avoid potential stack overflow
-        paths_to_process = [self.config.path.rstrip("/") if self.config.path else ""]
-        processed_paths = set()
+        try:
+            repo_status, repo_body = self._api_get_json(
+                f"{self.api_base}/repos/{owner}/{repo}", timeout=10
+            )
+            if repo_status == 200:
+                branch = repo_body.get("default_branch", "main")
+                tree_status, payload = self._api_get_json(
+                    f"{self.api_base}/repos/{owner}/{repo}/git/trees/{branch}",
+                    params={"recursive": "1"},
+                    timeout=30,
+                )
+                if tree_status == 200:
+                    if not payload.get("truncated"):
+                        for item in payload.get("tree", []):
+                            if limit is not None and count >= limit:
+                                return
+                            if item.get("type") != "blob":
+                                continue
+                            file_path = item["path"]
+                            if self.config.path and not file_path.startswith(
+                                self.config.path
+                            ):
+                                continue
+                            if _file_ext(file_path) in _IMAGE_EXTS:
+                                yield ImageInfo(
+                                    url=f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{file_path}",
+                                    filename=Path(file_path).name,
+                                    size=item.get("size"),
+                                    created_at=None,
+                                    metadata={
+                                        "sha": item.get("sha"),
+                                        "path": file_path,
+                                    },
+                                )
+                                count += 1
+                        return
+                    self.logger.debug(
+                        "GitHub tree listing truncated, falling back to contents API"
+                    )
+        except Exception as e:
+            self.logger.error(f"Error listing GitHub tree: {e}")
 
-        while paths_to_process and (limit is None or count < limit):
-            path = paths_to_process.pop(0)
+        yield from self._list_images_contents(limit)
 
-            # Avoid processing the same path multiple times
-            if path in processed_paths:
-                continue
-            processed_paths.add(path)
+    def _list_images_contents(self, limit: int | None = None) -> Iterator[ImageInfo]:
+        """List images via the ``/contents`` API, one request per directory.
 
-            url = (
-                f"{self.api_base}/repos/{self.config.owner}/{self.config.repo}/contents"
-            )
-            if path:
-                url += f"/{path}"
+        Fallback used when the recursive tree response is truncated.
+        Directories are fetched concurrently (breadth-first) since each
+        request is purely network-bound; results are yielded from the
+        calling thread as responses complete.
 
-            try:
-                response = requests.get(url, headers=headers, timeout=30)
+        Parameters
+        ----------
+        limit : int, optional
+            Limit the number of images returned. If None, no limit is applied.
 
+        Yields
+        ------
+        ImageInfo
+            Information about each image.
+        """
+        count = 0
+        max_workers = getattr(self.config, "max_concurrent_downloads", None) or 4
+        base_url = (
+            f"{self.api_base}/repos/{self.config.owner}/{self.config.repo}/contents"
+        )
+        stop = threading.Event()
+
+        def fetch(path: str) -> list:
+            if stop.is_set():
+                return []
+            url = f"{base_url}/{path}" if path else base_url
+            try:
+                response = self._session.get(url, timeout=30)
                 if response.status_code != 200:
                     self.logger.warning(
                         f"Unable to get GitHub directory contents: {path}, Status code: {response.status_code}"
                     )
-                    continue
-
-                contents = response.json()
-
-                for item in contents:
-                    if limit is not None and count >= limit:
-                        break
-
-                    if item["type"] == "file":
-                        file_path = item["path"]
-                        file_ext = Path(file_path).suffix.lower()
-
-                        # Check if path matches configured path prefix
-                        if self.config.path and not file_path.startswith(
-                            self.config.path
-                        ):
-                            continue
-
-                        if file_ext in image_extensions:
-                            # Construct image URL
-                            url = item["download_url"]
-
-                            yield ImageInfo(
-                                url=url,
-                                filename=Path(file_path).name,
-                                size=item.get("size"),
-                                created_at=None,  # GitHub API doesn't provide creation time
-                                metadata={"sha": item.get("sha"), "path": file_path},
-                            )
-                            count += 1
-
-                    elif item["type"] == "dir":
-                        # Add subdirectory to processing queue
-                        paths_to_process.append(item["path"])
-
+                    return []
+                return response.json()
             except Exception as e:
                 self.logger.error(f"Error listing GitHub files: {e}")
+                return []
+
+        root = self.config.path.rstrip("/") if self.config.path else ""
+        processed_paths = {root}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(fetch, root)}
+            while pending and not stop.is_set():
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for item in future.result():
+                        if item["type"] == "file":
+                            file_path = item["path"]
+
+                            # Check if path matches configured path prefix
+                            if self.config.path and not file_path.startswith(
+                                self.config.path
+                            ):
+                                continue
+
+                            if _file_ext(file_path) in _IMAGE_EXTS:
+                                yield ImageInfo(
+                                    url=item["download_url"],
+                                    filename=Path(file_path).name,
+                                    size=item.get("size"),
+                                    created_at=None,  # GitHub API doesn't provide creation time
+                                    metadata={
+                                        "sha": item.get("sha"),
+                                        "path": file_path,
+                                    },
+                                )
+                                count += 1
+                                if limit is not None and count >= limit:
+                                    # Workers check the event before
+                                    # fetching, so shutdown stays quick
+                                    stop.set()
+                                    break
+
+                        elif (
+                            item["type"] == "dir"
+                            and item["path"] not in processed_paths
+                        ):
+                            processed_paths.add(item["path"])
+                            pending.add(executor.submit(fetch, item["path"]))
+                    if stop.is_set():
+                        break
 
     def download_image(self, image_info: ImageInfo, output_path: Path) -> bool:
         """Download image from GitHub
@@ -146,12 +318,20 @@ class GitHubProvider(BaseProvider):
             url = image_info.url
 
             # Download the image
-            response = requests.get(url, timeout=30, stream=True)
+            response = self._session.get(url, timeout=30, stream=True)
             response.raise_for_status()
 
-            with open(output_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Write to a .part file and publish atomically, so an
+            # interrupted transfer never looks like a complete image
+            tmp = output_path.with_name(output_path.name + ".part")
+            try:
+                with open(tmp, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+                os.replace(tmp, output_path)
+            except Exception:
+                tmp.unlink(missing_ok=True)
+                raise
 
             self.logger.debug(f"Successfully downloaded image: {image_info.filename}")
             return True
@@ -163,47 +343,77 @@ class GitHubProvider(BaseProvider):
     def get_image_count(self) -> int | None:
         """Get total number of images in GitHub repository
 
+        Counts blobs from a single recursive tree fetch when possible,
+        sharing the round-trip with the connection check; results are
+        cached for a short TTL so an info-render cycle only hits the
+        API once. Falls back to the per-directory walk when the tree
+        response is truncated.
+
         Returns
         -------
         int or None
             The total number of images, or None if unable to determine.
         """
+        now = time.monotonic()
+        if (
+            self._count_cache is not None
+            and now - self._count_cache[0] < self._CONN_CACHE_TTL
+        ):
+            return self._count_cache[1]
+
+        try:
+            repo_status, repo_body = self._api_get_json(
+                f"{self.api_base}/repos/{self.config.owner}/{self.config.repo}",
+                timeout=10,
+            )
+            if repo_status == 200:
+                # The repo probe doubles as a connection check
+                self._conn_cache = (time.monotonic(), True)
+                branch = repo_body.get("default_branch", "main")
+                tree_status, payload = self._api_get_json(
+                    f"{self.api_base}/repos/{self.config.owner}/{self.config.repo}/git/trees/{branch}",
+                    params={"recursive": "1"},
+                    timeout=30,
+                )
+                if tree_status == 200 and not payload.get("truncated"):
+                    count = sum(
+                        1
+                        for item in payload.get("tree", [])
+                        if item.get("type") == "blob"
+                        and (
+                            not self.config.path
+                            or item["path"].startswith(self.config.path)
+                        )
+                        and _file_ext(item["path"]) in _IMAGE_EXTS
+                    )
+                    self._count_cache = (now, count)
+                    return count
+        except Exception as e:
+            self.logger.warning(f"Failed to count GitHub images via tree API: {e}")
+
         try:
             count = 0
-            image_extensions = {
-                ".jpg",
-                ".jpeg",
-                ".png",
-                ".gif",
-                ".bmp",
-                ".webp",
-                ".svg",
-            }
 
-            # Use iterative approach for counting as well
-            paths_to_process = [
-                self.config.path.rstrip("/") if self.config.path else ""
-            ]
+            # Use iterative approach for counting as well; deque gives
+            # O(1) popleft where list.pop(0) shifts the whole queue
+            paths_to_process = deque(
+                [self.config.path.rstrip("/") if self.config.path else ""]
+            )
             processed_paths = set()
 
             while paths_to_process:
-                path = paths_to_process.pop(0)
+                path = paths_to_process.popleft()
 
                 # Avoid processing the same path multiple times
                 if path in processed_paths:
                     continue
                 processed_paths.add(path)
 
-                headers = {
-                    "Authorization": f"token {self.config.token}",
-                    "Accept": "application/vnd.github.v3+json",
-                }
-
                 url = f"{self.api_base}/repos/{self.config.owner}/{self.config.repo}/contents"
                 if path:
                     url += f"/{path}"
 
-                response = requests.get(url, headers=headers, timeout=30)
+                response = self._session.get(url, timeout=30)
 
                 if response.status_code != 200:
                     self.logger.warning(
@@ -216,7 +426,6 @@ class GitHubProvider(BaseProvider):
                 for item in contents:
                     if item["type"] == "file":
                         file_path = item["path"]
-                        file_ext = Path(file_path).suffix.lower()
 
                         # Check if path matches configured path prefix
                         if self.config.path and not file_path.startswith(
@@ -224,12 +433,13 @@ class GitHubProvider(BaseProvider):
                         ):
                             continue
 
-                        if file_ext in image_extensions:
+                        if _file_ext(file_path) in _IMAGE_EXTS:
                             count += 1
                     elif item["type"] == "dir":
                         # Add subdirectory to processing queue
                         paths_to_process.append(item["path"])
 
+            self._count_cache = (now, count)
             return count
         except Exception as e:
             self.logger.warning(f"Failed to get total number of GitHub images: {e}")
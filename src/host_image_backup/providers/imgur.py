@@ -1,12 +1,20 @@
+import os
 import time
 from collections.abc import Iterator
 from pathlib import Path
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config import ImgurConfig
-from .base import SUPPORTED_IMAGE_EXTENSIONS, BaseProvider, ImageInfo
+from .base import (
+    SUPPORTED_IMAGE_EXTENSIONS,
+    BaseProvider,
+    ImageInfo,
+    ProviderPermanentError,
+)
 
 
 class ImgurProvider(BaseProvider):
@@ -17,6 +25,50 @@ class ImgurProvider(BaseProvider):
         self.config: ImgurConfig = config
         self.logger = logger
         self.api_base = "https://api.imgur.com/3"
+        # One keep-alive session for API calls and downloads: the auth
+        # header is set once and TCP/TLS handshakes amortize across the
+        # whole run instead of costing one per request
+        self.session = requests.Session()
+        self.session.headers["Authorization"] = f"Bearer {config.access_token}"
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                respect_retry_after_header=True,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Account responses serve both test_connection and
+        # get_image_count for 60s, which would otherwise hit
+        # /account/me back to back
+        self._account_cache: tuple[float, dict] | None = None
+
+    def _get_account(self) -> dict | None:
+        """Fetch the account payload, cached for 60 seconds
+
+        Returns
+        -------
+        dict or None
+            Account data, or None when the request fails.
+        """
+        now = time.monotonic()
+        if self._account_cache is not None and now - self._account_cache[0] < 60:
+            return self._account_cache[1]
+
+        response = self.session.get(f"{self.api_base}/account/me", timeout=10)
+        if response.status_code != 200:
+            return None
+        data = response.json()
+        if not data.get("success"):
+            return None
+
+        account = data.get("data", {})
+        self._account_cache = (now, account)
+        return account
 
     def test_connection(self) -> bool:
         """Test Imgur connection
@@ -27,11 +79,7 @@ class ImgurProvider(BaseProvider):
             True if connection is successful, False otherwise.
         """
         try:
-            headers = {"Authorization": f"Bearer {self.config.access_token}"}
-            response = requests.get(
-                f"{self.api_base}/account/me", headers=headers, timeout=10
-            )
-            return response.status_code == 200
+            return self._get_account() is not None
         except Exception as e:
             self.logger.error(f"Imgur connection test failed: {e}")
             return False
@@ -50,7 +98,6 @@ class ImgurProvider(BaseProvider):
             Information about each image.
         """
         try:
-            headers = {"Authorization": f"Bearer {self.config.access_token}"}
             count = 0
             page = 0
 
@@ -59,9 +106,8 @@ class ImgurProvider(BaseProvider):
                     break
 
                 # Get user's images
-                response = requests.get(
+                response = self.session.get(
                     f"{self.api_base}/account/me/images/{page}",
-                    headers=headers,
                     timeout=30,
                 )
 
@@ -163,16 +209,33 @@ class ImgurProvider(BaseProvider):
             # Ensure the output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            response = requests.get(image_info.url, timeout=30, stream=True)
+            response = self.session.get(image_info.url, timeout=30, stream=True)
             response.raise_for_status()
 
-            with open(output_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Write to a .part file and publish atomically, so an
+            # interrupted transfer never looks like a complete image
+            tmp = output_path.with_name(output_path.name + ".part")
+            try:
+                with open(tmp, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+                os.replace(tmp, output_path)
+            except Exception:
+                tmp.unlink(missing_ok=True)
+                raise
 
             self.logger.debug(f"Successfully downloaded image: {image_info.filename}")
             return True
 
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status and 400 <= status < 500 and status not in (408, 429):
+                # Broken link or revoked access; retrying cannot help
+                raise ProviderPermanentError(
+                    f"HTTP {status} for {image_info.url}"
+                ) from e
+            self.logger.error(f"Failed to download image {image_info.filename}: {e}")
+            return False
         except Exception as e:
             self.logger.error(f"Failed to download image {image_info.filename}: {e}")
             return False
@@ -186,17 +249,9 @@ class ImgurProvider(BaseProvider):
             The total number of images, or None if unable to determine.
         """
         try:
-            headers = {"Authorization": f"Bearer {self.config.access_token}"}
-            response = requests.get(
-                f"{self.api_base}/account/me", headers=headers, timeout=10
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("success"):
-                    account_data = data.get("data", {})
-                    return account_data.get("total_images", 0)
-
+            account = self._get_account()
+            if account is not None:
+                return account.get("total_images", 0)
             return None
         except Exception as e:
             self.logger.warning(f"Failed to get the total number of Imgur images: {e}")
@@ -1,9 +1,18 @@
+import os
+import queue
+import shutil
+import time
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
 
 import oss2
+import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config import OSSConfig
 from .base import (
@@ -14,6 +23,23 @@ from .base import (
     SingleUploadResult,
 )
 
+# endswith on a tuple is a single C-level call per key, with no
+# intermediate Path or substring allocation
+_IMG_EXT_TUPLE = tuple(SUPPORTED_IMAGE_EXTENSIONS)
+
+# Objects at least this large are fetched as parallel range-GETs that can
+# resume across failures; smaller ones use a single GET to avoid overhead
+_MULTIGET_THRESHOLD = 20 * 1024 * 1024
+_MULTIGET_PART_SIZE = 8 * 1024 * 1024
+
+# Mid-sized objects stream through a signed URL with a 1 MiB C-level
+# copy loop instead of oss2's Python-buffer reads
+_SIGNED_STREAM_THRESHOLD = 4 * 1024 * 1024
+
+# OSS caps list pages at 1000 keys; the oss2 default of 100 would cost
+# ten times as many list API calls
+_LIST_MAX_KEYS = 1000
+
 
 class OSSProvider(BaseProvider):
     """Alibaba Cloud OSS Provider"""
@@ -23,6 +49,29 @@ class OSSProvider(BaseProvider):
         self.config: OSSConfig = config
         self.logger = logger
         self._bucket = None
+        self._count_cache: tuple[float, int] | None = None
+        self._conn_ok_until: float = 0.0
+        # Memoized enumeration shared across list_images calls, so a
+        # preview followed by a full backup lists the bucket only once
+        self._iter_cache: list[ImageInfo] = []
+        self._iter_exhausted = False
+        self._source_iter: Iterator[ImageInfo] | None = None
+        # Keep-alive session for signed-URL streaming downloads
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=getattr(config, "retry_count", None) or 3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Directories already created this run; skips one syscall per
+        # download in a batch
+        self._mkdir_cache: set[Path] = set()
 
     @property
     def bucket(self) -> oss2.Bucket:
@@ -38,89 +87,212 @@ class OSSProvider(BaseProvider):
             self._bucket = oss2.Bucket(auth, self.config.endpoint, self.config.bucket)
         return self._bucket
 
+    def _list_prefixes(self) -> list[str]:
+        """Key prefixes to list server-side
+
+        Configured ``image_prefixes`` narrow the query so the server
+        never returns unrelated keys; otherwise the single ``prefix``
+        is used.
+
+        Returns
+        -------
+        list[str]
+            Prefixes to enumerate.
+        """
+        return getattr(self.config, "image_prefixes", None) or [self.config.prefix]
+
     def test_connection(self) -> bool:
         """Test OSS connection
 
+        A successful probe is remembered for 60 seconds, since CLI
+        flows tend to test reachability several times per invocation.
+
         Returns
         -------
         bool
             True if connection is successful, False otherwise.
         """
+        if time.monotonic() < self._conn_ok_until:
+            return True
         try:
             # Try to get bucket information
             self.bucket.get_bucket_info()
+            self._conn_ok_until = time.monotonic() + 60
             return True
         except Exception as e:
+            self._conn_ok_until = 0.0
             self.logger.error(f"OSS connection test failed: {e}")
             return False
 
-    def list_images(self, limit: int | None = None) -> Iterator[ImageInfo]:
-        """List all images in OSS
+    def _image_info_from_obj(self, obj) -> ImageInfo:
+        """Build an ImageInfo from a listed OSS object
 
         Parameters
         ----------
-        limit : int, optional
-            Limit the number of images returned. If None, no limit is applied.
+        obj : oss2.models.SimplifiedObjectInfo
+            Object entry from a bucket listing.
+
+        Returns
+        -------
+        ImageInfo
+            Information about the image.
+        """
+        # Construct image URL
+        url = f"https://{self.config.bucket}.{self.config.endpoint}/{obj.key}"
+
+        # Handle last_modified - it might be a datetime object or an
+        # integer timestamp. Stored raw: isoformat() per object adds
+        # up on large listings and callers format on access
+        created_at = None
+        if obj.last_modified:
+            if hasattr(obj.last_modified, "isoformat"):
+                created_at = obj.last_modified.replace(tzinfo=timezone.utc)
+            elif isinstance(obj.last_modified, int | float):
+                created_at = datetime.fromtimestamp(obj.last_modified, tz=timezone.utc)
+            else:
+                created_at = str(obj.last_modified)
+
+        return ImageInfo(
+            url=url,
+            filename=Path(obj.key).name,
+            size=obj.size,
+            created_at=created_at,
+            metadata={
+                "key": obj.key,
+                "etag": obj.etag,
+                "storage_class": obj.storage_class,
+            },
+        )
+
+    def _fetch_images_sharded(self, shards: list[str]) -> Iterator[ImageInfo]:
+        """Enumerate the bucket with one listing thread per key shard
+
+        Each shard's cursor advances independently, so listing a large
+        bucket is no longer serialized on a single marker. Items arrive
+        in shard-interleaved order.
+
+        Parameters
+        ----------
+        shards : list of str
+            Key fragments appended to ``prefix``, one listing each.
 
         Yields
         ------
         ImageInfo
             Information about each image.
         """
-        try:
-            count = 0
-            # Supported image extensions
-            image_extensions = SUPPORTED_IMAGE_EXTENSIONS
+        done = object()
+        results: queue.Queue = queue.Queue()
+
+        def produce(shard: str) -> None:
+            try:
+                for obj in oss2.ObjectIterator(
+                    self.bucket,
+                    prefix=self.config.prefix + shard,
+                    max_keys=_LIST_MAX_KEYS,
+                ):
+                    if obj.key.lower().endswith(_IMG_EXT_TUPLE):
+                        results.put(obj)
+            except Exception as e:
+                self.logger.error(f"Failed to list OSS shard {shard!r}: {e}")
+            finally:
+                results.put(done)
+
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            for shard in shards:
+                executor.submit(produce, shard)
+            finished = 0
+            while finished < len(shards):
+                item = results.get()
+                if item is done:
+                    finished += 1
+                    continue
+                yield self._image_info_from_obj(item)
+
+    def _fetch_images(self) -> Iterator[ImageInfo]:
+        """Enumerate every image in the bucket
 
-            for obj in oss2.ObjectIterator(self.bucket, prefix=self.config.prefix):
-                if limit and count >= limit:
-                    break
+        Yields
+        ------
+        ImageInfo
+            Information about each image.
+        """
+        shards = getattr(self.config, "list_shards", None)
+        if shards:
+            yield from self._fetch_images_sharded(shards)
+            return
 
+        try:
+            for obj in chain.from_iterable(
+                oss2.ObjectIterator(self.bucket, prefix=prefix, max_keys=_LIST_MAX_KEYS)
+                for prefix in self._list_prefixes()
+            ):
                 # Check if it's an image file
-                file_ext = Path(obj.key).suffix.lower()
-                if file_ext not in image_extensions:
+                if not obj.key.lower().endswith(_IMG_EXT_TUPLE):
                     continue
 
-                # Construct image URL
-                url = f"https://{self.config.bucket}.{self.config.endpoint}/{obj.key}"
-
-                # Handle last_modified - it might be a datetime object or an integer timestamp
-                created_at = None
-                if obj.last_modified:
-                    if hasattr(obj.last_modified, "isoformat"):
-                        # It's a datetime object
-                        created_at = obj.last_modified.replace(
-                            tzinfo=timezone.utc
-                        ).isoformat()
-                    elif isinstance(obj.last_modified, int | float):
-                        # It's a timestamp, convert it to ISO format
-                        created_at = datetime.fromtimestamp(
-                            obj.last_modified, tz=timezone.utc
-                        ).isoformat()
-                    else:
-                        # Try to convert string representation to datetime
-                        from contextlib import suppress
-
-                        with suppress(Exception):
-                            created_at = str(obj.last_modified)
-
-                yield ImageInfo(
-                    url=url,
-                    filename=Path(obj.key).name,
-                    size=obj.size,
-                    created_at=created_at,
-                    metadata={
-                        "key": obj.key,
-                        "etag": obj.etag,
-                        "storage_class": obj.storage_class,
-                    },
-                )
-                count += 1
+                yield self._image_info_from_obj(obj)
 
         except Exception as e:
             self.logger.error(f"Failed to list OSS images: {e}")
             raise
 
+    def list_images(self, limit: int | None = None) -> Iterator[ImageInfo]:
+        """List all images in OSS
+
+        Results are memoized: items already fetched by an earlier call
+        (e.g. a limited preview) are replayed from memory, and the
+        underlying bucket enumeration resumes where it left off instead
+        of restarting.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Limit the number of images returned. If None, no limit is applied.
+
+        Yields
+        ------
+        ImageInfo
+            Information about each image.
+        """
+        count = 0
+        for info in self._iter_cache:
+            if limit and count >= limit:
+                return
+            yield info
+            count += 1
+
+        if self._iter_exhausted:
+            return
+
+        if self._source_iter is None:
+            self._source_iter = self._fetch_images()
+
+        while not (limit and count >= limit):
+            try:
+                info = next(self._source_iter)
+            except StopIteration:
+                self._iter_exhausted = True
+                self._source_iter = None
+                # The cache now holds every object, so remember the
+                # total instead of re-listing in get_image_count
+                self._count_cache = (time.monotonic(), len(self._iter_cache))
+                return
+            self._iter_cache.append(info)
+            yield info
+            count += 1
+
+    def clear_listing_cache(self) -> None:
+        """Drop memoized listing state
+
+        Forces the next ``list_images`` or ``get_image_count`` call to
+        re-enumerate the bucket.
+        """
+        self._iter_cache = []
+        self._iter_exhausted = False
+        self._source_iter = None
+        self._count_cache = None
+
     def download_image(self, image_info: ImageInfo, output_path: Path) -> bool:
         """Download image from OSS
 
@@ -142,8 +314,40 @@ class OSSProvider(BaseProvider):
             if not key:
                 key = image_info.filename
 
-            # Download image
-            self.bucket.get_object_to_file(key, str(output_path))
+            # Ensure the output directory exists
+            if output_path.parent not in self._mkdir_cache:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                self._mkdir_cache.add(output_path.parent)
+
+            # Download into a .part file and publish atomically so an
+            # interrupted run never leaves a truncated image behind.
+            # Large objects go through the resumable multiget path
+            # (parallel range-GETs, resume sidecar kept under
+            # .oss_resume next to the output file)
+            tmp = output_path.with_name(output_path.name + ".part")
+            size = image_info.size
+            if size is not None and size >= _MULTIGET_THRESHOLD:
+                oss2.resumable_download(
+                    self.bucket,
+                    key,
+                    str(tmp),
+                    multiget_threshold=_MULTIGET_THRESHOLD,
+                    part_size=_MULTIGET_PART_SIZE,
+                    num_threads=4,
+                    store=oss2.ResumableDownloadStore(
+                        root=str(output_path.parent), dir=".oss_resume"
+                    ),
+                )
+            elif size is not None and size >= _SIGNED_STREAM_THRESHOLD:
+                url = self.bucket.sign_url("GET", key, 3600)
+                with self._session.get(url, timeout=30, stream=True) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    with open(tmp, "wb") as f:
+                        shutil.copyfileobj(response.raw, f, length=1 << 20)
+            else:
+                self.bucket.get_object_to_file(key, str(tmp))
+            os.replace(tmp, output_path)
             return True
         except Exception as e:
             self.logger.error(f"Failed to download image {image_info.url}: {e}")
@@ -152,20 +356,37 @@ class OSSProvider(BaseProvider):
     def get_image_count(self) -> int | None:
         """Get total number of images in OSS
 
+        Prefers the count remembered from the most recent complete
+        ``list_images`` pass and re-lists the bucket otherwise. The
+        bucket stat endpoint is deliberately not used: it counts every
+        object in the bucket regardless of prefix or type, and that
+        upper bound feeds the progress-bar total and the disk-space
+        preflight, which both need a real image count or ``None``.
+
         Returns
         -------
         int or None
             The total number of images, or None if unable to determine.
         """
-        try:
-            count = 0
-            image_extensions = SUPPORTED_IMAGE_EXTENSIONS
+        if (
+            self._count_cache is not None
+            and time.monotonic() - self._count_cache[0] < self._CONN_CACHE_TTL
+        ):
+            return self._count_cache[1]
 
-            for obj in oss2.ObjectIterator(self.bucket, prefix=self.config.prefix):
-                file_ext = Path(obj.key).suffix.lower()
-                if file_ext in image_extensions:
-                    count += 1
+        try:
+            count = sum(
+                1
+                for obj in chain.from_iterable(
+                    oss2.ObjectIterator(
+                        self.bucket, prefix=prefix, max_keys=_LIST_MAX_KEYS
+                    )
+                    for prefix in self._list_prefixes()
+                )
+                if obj.key.lower().endswith(_IMG_EXT_TUPLE)
+            )
 
+            self._count_cache = (time.monotonic(), count)
             return count
         except Exception as e:
             self.logger.warning(f"Failed to get total number of OSS images: {e}")
@@ -1,14 +1,17 @@
+import importlib
+import json
+import os
+import sys
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from loguru import logger
 from rich.console import Console
 
 from .base import BaseProvider
-from .cos import COSProvider
-from .github import GitHubProvider
-from .imgur import ImgurProvider
-from .oss import OSSProvider
-from .sms import SMSProvider
 
 try:
     from importlib.metadata import EntryPoint, entry_points
@@ -16,6 +19,39 @@ except Exception:
     entry_points = None
     EntryPoint = object
 
+# Built-in providers referenced as (module, attribute) and imported on first
+# use; several of the provider modules drag in heavy SDKs (oss2, cos-sdk,
+# requests) that should not be paid for unless that provider is used.
+_BUILTIN_PROVIDERS: Mapping[str, tuple[str, str]] = MappingProxyType(
+    {
+        "oss": ("host_image_backup.providers.oss", "OSSProvider"),
+        "cos": ("host_image_backup.providers.cos", "COSProvider"),
+        "sms": ("host_image_backup.providers.sms", "SMSProvider"),
+        "imgur": ("host_image_backup.providers.imgur", "ImgurProvider"),
+        "github": ("host_image_backup.providers.github", "GitHubProvider"),
+    }
+)
+
+# Cheapest possible membership test for the hot is-supported checks
+_BUILTIN_NAMES = frozenset(_BUILTIN_PROVIDERS)
+
+# Entry-point discovery scans the metadata of every installed distribution,
+# which is expensive on fat environments. The result is memoized to disk
+# keyed by the mtimes of the sys.path directories; installing or removing
+# a package changes a directory mtime and invalidates the cache.
+_ENTRYPOINT_CACHE = Path.home() / ".cache" / "host-image-backup" / "entrypoints.json"
+
+
+def _sys_path_key() -> list[list]:
+    """Build the entry-point cache key from sys.path directory mtimes."""
+    key = []
+    for entry in sys.path:
+        try:
+            key.append([entry, os.stat(entry or ".").st_mtime_ns])
+        except OSError:
+            continue
+    return key
+
 
 class ProviderManager:
     """Provider manager for Host Image Backup.
@@ -35,14 +71,17 @@ class ProviderManager:
         self._console = Console()
         self._logger = logger
 
-        # Provider class mapping (initially includes built-in)
-        self._provider_classes: dict[str, type[BaseProvider]] = {
-            "oss": OSSProvider,
-            "cos": COSProvider,
-            "sms": SMSProvider,
-            "imgur": ImgurProvider,
-            "github": GitHubProvider,
-        }
+        # Provider class mapping; built-in entries start as (module, attr)
+        # specs and are swapped for the resolved class on first use. The
+        # shared read-only mapping is promoted to a private dict on first
+        # write (copy-on-write), so constructing a manager allocates nothing
+        self._provider_classes: Mapping[str, type[BaseProvider] | tuple[str, str]] = (
+            _BUILTIN_PROVIDERS
+        )
+
+        # Names of all known providers; unioned when discovery or
+        # registration adds a provider (rare), probed on every lookup
+        self._supported_names: frozenset[str] = _BUILTIN_NAMES
 
         # Flag: whether dynamic discovery has been performed
         self._discovered = False
@@ -50,6 +89,14 @@ class ProviderManager:
         # Cache for provider instances
         self._provider_cache: dict[str, BaseProvider] = {}
 
+    def _mutable_provider_classes(
+        self,
+    ) -> dict[str, "type[BaseProvider] | tuple[str, str]"]:
+        """Promote the shared provider mapping to a private dict on first write."""
+        if self._provider_classes is _BUILTIN_PROVIDERS:
+            self._provider_classes = dict(_BUILTIN_PROVIDERS)
+        return self._provider_classes  # type: ignore[return-value]
+
     def get_provider(self, provider_name: str) -> BaseProvider | None:
         """Get provider instance.
 
@@ -87,7 +134,7 @@ class ProviderManager:
             return None
 
         # Get provider class
-        provider_class = self._provider_classes.get(provider_name)
+        provider_class = self.get_provider_class(provider_name)
         if not provider_class:
             self._logger.error(f"Provider implementation not found: {provider_name}")
             return None
@@ -119,7 +166,7 @@ class ProviderManager:
             return False
 
         try:
-            result = provider.test_connection()
+            result = provider.check_connection()
             if result:
                 self._console.print(
                     f"[green]Provider {provider_name} connection test successful[/green]"
@@ -135,6 +182,30 @@ class ProviderManager:
             )
             return False
 
+    def test_all_providers(self) -> dict[str, bool]:
+        """Test connections of all enabled providers concurrently.
+
+        Each test is a network round-trip, so running them in a pool
+        bounds the total wait by the slowest provider instead of the
+        sum of all of them.
+
+        Returns
+        -------
+        dict[str, bool]
+            Dictionary mapping provider names to connection test results.
+        """
+        enabled = self.get_enabled_providers()
+        if not enabled:
+            return {}
+
+        config = self._config_manager.config
+        max_workers = min(len(enabled), config.max_concurrent_downloads or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                name: executor.submit(self.test_provider, name) for name in enabled
+            }
+            return {name: future.result() for name, future in futures.items()}
+
     def get_provider_info(self, provider_name: str) -> dict[str, Any]:
         """Get provider information.
 
@@ -152,18 +223,25 @@ class ProviderManager:
         if not provider:
             return {}
 
-        # Test connection
-        connection_status = "Normal" if provider.test_connection() else "Failed"
+        # Both calls are network round-trips; overlapping them halves
+        # the info-panel latency on high-latency providers
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            conn_future = executor.submit(provider.check_connection)
+            count_future = executor.submit(provider.get_image_count)
 
-        # Get image count
-        try:
-            image_count = provider.get_image_count()
-            count_text = (
-                str(image_count) if image_count is not None else "Not available"
-            )
-        except Exception as e:
-            self._logger.error(f"Error getting image count for {provider_name}: {e}")
-            count_text = "Failed to get"
+            # Connection test (TTL-cached on the provider instance)
+            connection_status = "Normal" if conn_future.result() else "Failed"
+
+            try:
+                image_count = count_future.result()
+                count_text = (
+                    str(image_count) if image_count is not None else "Not available"
+                )
+            except Exception as e:
+                self._logger.error(
+                    f"Error getting image count for {provider_name}: {e}"
+                )
+                count_text = "Failed to get"
 
         return {
             "name": provider_name.upper(),
@@ -228,11 +306,15 @@ class ProviderManager:
         list[str]
             List of enabled provider names.
         """
-        enabled_providers = []
-        for provider_name in self.list_providers():
-            if self._config_manager.is_provider_enabled(provider_name):
-                enabled_providers.append(provider_name)
-        return enabled_providers
+        # One pass over the already-loaded provider configs; avoids a
+        # get_provider_config lookup per known provider name
+        self._ensure_discovery()
+        providers = self._config_manager.config.providers
+        return [
+            name
+            for name, config in providers.items()
+            if config.enabled and name in self._provider_classes
+        ]
 
     def validate_all_providers(self) -> dict[str, bool]:
         """Validate all configured providers.
@@ -242,11 +324,20 @@ class ProviderManager:
         Dict[str, bool]
             Dictionary mapping provider names to validation results.
         """
-        results = {}
-        for provider_name in self.list_providers():
-            if self._config_manager.is_provider_enabled(provider_name):
-                results[provider_name] = self.validate_provider_config(provider_name)
-        return results
+        enabled = self.get_enabled_providers()
+        if not enabled:
+            return {}
+
+        # Validation can include reachability checks, so run providers
+        # concurrently; the dict comprehension preserves provider order
+        config = self._config_manager.config
+        max_workers = min(len(enabled), config.max_concurrent_downloads or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                name: executor.submit(self.validate_provider_config, name)
+                for name in enabled
+            }
+            return {name: future.result() for name, future in futures.items()}
 
     def validate_provider_config(self, provider_name: str) -> bool:
         """Validate provider configuration.
@@ -301,7 +392,19 @@ class ProviderManager:
             Provider class if found, None otherwise.
         """
         self._ensure_discovery()
-        return self._provider_classes.get(provider_name)
+        entry = self._provider_classes.get(provider_name)
+        if isinstance(entry, tuple):
+            module_path, class_name = entry
+            try:
+                entry = getattr(importlib.import_module(module_path), class_name)
+            except Exception as e:
+                self._logger.error(
+                    f"Failed to import provider {provider_name} "
+                    f"({module_path}.{class_name}): {e}"
+                )
+                return None
+            self._mutable_provider_classes()[provider_name] = entry
+        return entry
 
     def register_provider(
         self, provider_name: str, provider_class: type[BaseProvider]
@@ -315,7 +418,8 @@ class ProviderManager:
         provider_class : Type[BaseProvider]
             Provider class to register.
         """
-        self._provider_classes[provider_name] = provider_class
+        self._mutable_provider_classes()[provider_name] = provider_class
+        self._supported_names |= {provider_name}
         self._logger.info(f"Registered provider: {provider_name}")
 
     # ---------- Internal implementation of dynamic discovery ----------
@@ -333,6 +437,22 @@ class ProviderManager:
                 "importlib.metadata.entry_points not available, skipping dynamic discovery."
             )
             return
+
+        # Replay a cached scan when the installed distribution set is
+        # unchanged; entries are stored as "module:attr" and resolved
+        # lazily by get_provider_class like the built-in specs
+        cache_key = _sys_path_key()
+        cached = self._read_entrypoint_cache(cache_key)
+        if cached is not None:
+            for name, value in cached.items():
+                if name in self._provider_classes:
+                    continue
+                module_path, _, attr = value.partition(":")
+                if module_path and attr:
+                    self._mutable_provider_classes()[name] = (module_path, attr)
+                    self._supported_names |= {name}
+            return
+
         try:
             eps = entry_points()
             group_name = "host_image_backup.providers"
@@ -346,6 +466,7 @@ class ProviderManager:
                 )
 
             added = []
+            discovered: dict[str, str] = {}
             for ep in selected:
                 name = getattr(ep, "name", None)
                 if not name or name in self._provider_classes:
@@ -361,12 +482,17 @@ class ProviderManager:
                             f"Entry point '{name}' object is not a subclass of BaseProvider, ignored."
                         )
                         continue
-                    self._provider_classes[name] = obj
+                    self._mutable_provider_classes()[name] = obj
+                    self._supported_names |= {name}
                     added.append(name)
+                    value = getattr(ep, "value", None)
+                    if value:
+                        discovered[name] = value
                 except Exception as exc:  # pragma: no cover - just log
                     self._logger.error(
                         f"Failed to load provider entry point '{name}': {exc}"
                     )
+            self._write_entrypoint_cache(cache_key, discovered)
             if added:
                 self._logger.info(
                     "Dynamically discovered provider(s): " + ", ".join(sorted(added))
@@ -376,6 +502,41 @@ class ProviderManager:
         except Exception as e:  # pragma: no cover
             self._logger.error(f"Failed to scan provider entry points: {e}")
 
+    @staticmethod
+    def _read_entrypoint_cache(key: list[list]) -> dict[str, str] | None:
+        """Read the memoized entry-point scan if its key still matches.
+
+        Returns
+        -------
+        dict[str, str] or None
+            Mapping of provider name to "module:attr", or None on a miss
+            or any read error.
+        """
+        try:
+            with open(_ENTRYPOINT_CACHE, encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("key") == key:
+                providers = payload.get("providers")
+                if isinstance(providers, dict):
+                    return providers
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unusable entry-point cache: {e}")
+        return None
+
+    @staticmethod
+    def _write_entrypoint_cache(key: list[list], providers: dict[str, str]) -> None:
+        """Persist the entry-point scan result atomically (best-effort)."""
+        try:
+            _ENTRYPOINT_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = _ENTRYPOINT_CACHE.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "providers": providers}, f)
+            os.replace(tmp_file, _ENTRYPOINT_CACHE)
+        except Exception as e:
+            logger.debug(f"Failed to write entry-point cache: {e}")
+
     def is_provider_supported(self, provider_name: str) -> bool:
         """Check if provider is supported.
 
@@ -389,4 +550,4 @@ class ProviderManager:
         bool
             True if provider is supported, False otherwise.
         """
-        return provider_name in self._provider_classes
+        return provider_name in self._supported_names
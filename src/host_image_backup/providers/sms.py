@@ -1,12 +1,36 @@
+import os
+import shutil
+import sqlite3
 import time
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config import SMSConfig
-from .base import BaseProvider, ImageInfo
+from .base import BaseProvider, ImageInfo, ProviderPermanentError
+
+# Upload history is effectively append-only, so items seen on earlier
+# runs are kept locally and pagination stops at the first known page
+_HISTORY_CACHE = Path.home() / ".cache" / "host-image-backup" / "sms_history.sqlite"
+_HISTORY_TTL = 24 * 60 * 60
+
+_HISTORY_COLUMNS = (
+    "hash",
+    "url",
+    "filename",
+    "size",
+    "created_at",
+    "page",
+    "path",
+    "width",
+    "height",
+    "delete_url",
+)
 
 
 class SMSProvider(BaseProvider):
@@ -17,6 +41,54 @@ class SMSProvider(BaseProvider):
         self.config: SMSConfig = config
         self.logger = logger
         self.api_base = "https://sm.ms/api/v2"
+        # Shared session: the auth header is set once and pooled
+        # connections avoid a TCP/TLS handshake per API call or download
+        self.session = requests.Session()
+        self.session.headers["Authorization"] = config.api_token
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                respect_retry_after_header=True,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Directories already created this run; skips one syscall per
+        # download in a batch
+        self._mkdir_cache: set[Path] = set()
+        # Profile responses are reused for 60s by test_connection and
+        # get_image_count, which would otherwise hit /profile back to back
+        self._profile_cache: tuple[float, dict] | None = None
+        # Set by _iter_pages when a page fetch came back empty before
+        # the known total was reached (error or concurrent deletion)
+        self._pages_truncated = False
+
+    def _get_profile(self) -> dict | None:
+        """Fetch the account profile, cached for 60 seconds
+
+        Returns
+        -------
+        dict or None
+            Profile payload, or None when the request fails.
+        """
+        now = time.monotonic()
+        if self._profile_cache is not None and now - self._profile_cache[0] < 60:
+            return self._profile_cache[1]
+
+        response = self.session.get(f"{self.api_base}/profile", timeout=10)
+        if response.status_code != 200:
+            return None
+        data = response.json()
+        if not data.get("success"):
+            return None
+
+        profile = data.get("data", {})
+        self._profile_cache = (now, profile)
+        return profile
 
     def test_connection(self) -> bool:
         """Test SM.MS connection
@@ -27,18 +99,207 @@ class SMSProvider(BaseProvider):
             True if connection is successful, False otherwise.
         """
         try:
-            headers = {"Authorization": self.config.api_token}
-            response = requests.get(
-                f"{self.api_base}/profile", headers=headers, timeout=10
-            )
-            return response.status_code == 200
+            return self._get_profile() is not None
         except Exception as e:
             self.logger.error(f"SM.MS connection test failed: {e}")
             return False
 
+    def _fetch_page(self, page: int) -> tuple[list[dict], int, int]:
+        """Fetch one page of upload history
+
+        Parameters
+        ----------
+        page : int
+            Page number to fetch (1-based).
+
+        Returns
+        -------
+        tuple[list[dict], int, int]
+            Raw image items, current page and total page count; empty
+            items on any error.
+        """
+        response = self.session.get(
+            f"{self.api_base}/upload_history",
+            params={"page": page},
+            timeout=30,
+        )
+
+        if response.status_code != 200:
+            self.logger.error(f"Failed to get SM.MS image list: {response.status_code}")
+            return [], page, page
+
+        data = response.json()
+        if not data.get("success") or not data.get("data"):
+            self.logger.warning("SM.MS API returned no data or unsuccessful response")
+            return [], page, page
+
+        payload = data["data"]
+        return (
+            payload.get("data", []) or [],
+            payload.get("current_page", page),
+            payload.get("total_page", page),
+        )
+
+    @staticmethod
+    def _image_info_from_item(img: dict) -> ImageInfo | None:
+        """Build an ImageInfo from a raw upload-history item
+
+        Returns
+        -------
+        ImageInfo or None
+            None when the item is malformed or lacks a URL.
+        """
+        if not img or not isinstance(img, dict):
+            return None
+
+        url = img.get("url")
+        if not url:
+            return None
+
+        # Get filename (from storename or extract from link)
+        filename = img.get("storename") or Path(url).name
+
+        return ImageInfo(
+            url=url,
+            filename=filename,
+            size=img.get("size"),
+            created_at=img.get("created_at"),  # Already in ISO format
+            metadata={
+                "hash": img.get("hash"),
+                "delete": img.get("delete"),
+                "page": img.get("page"),
+                "path": img.get("path"),
+                "width": img.get("width"),
+                "height": img.get("height"),
+            },
+        )
+
+    def _history_db(self) -> sqlite3.Connection | None:
+        """Open the local upload-history cache, best effort
+
+        A cache older than 24 hours is discarded so deletions on the
+        remote side eventually propagate.
+
+        Returns
+        -------
+        sqlite3.Connection or None
+            None when the cache cannot be opened (treated as a miss).
+        """
+        try:
+            if (
+                _HISTORY_CACHE.exists()
+                and time.time() - _HISTORY_CACHE.stat().st_mtime > _HISTORY_TTL
+            ):
+                _HISTORY_CACHE.unlink()
+            _HISTORY_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(_HISTORY_CACHE)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS history ("
+                "hash TEXT PRIMARY KEY, url TEXT, filename TEXT, "
+                "size INTEGER, created_at TEXT, page INTEGER, path TEXT, "
+                "width INTEGER, height INTEGER, delete_url TEXT)"
+            )
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            return db
+        except Exception as e:
+            self.logger.debug(f"SM.MS history cache unavailable: {e}")
+            return None
+
+    @staticmethod
+    def clear_history_cache() -> None:
+        """Delete the local upload-history cache
+
+        Forces the next ``list_images`` run to re-fetch every page.
+        """
+        _HISTORY_CACHE.unlink(missing_ok=True)
+
+    def clear_listing_cache(self) -> None:
+        """Drop the local upload-history cache (``--refresh``)"""
+        self.clear_history_cache()
+
+    @staticmethod
+    def _history_is_complete(db: sqlite3.Connection) -> bool:
+        """Whether the cache was populated by a full, unlimited enumeration
+
+        Rows written by a limited run (``--limit``, previews) are only a
+        subset of the account; replaying them as if they were the whole
+        history would silently drop images.
+        """
+        row = db.execute("SELECT value FROM meta WHERE key = 'complete'").fetchone()
+        return row is not None and row[0] == "1"
+
+    @staticmethod
+    def _mark_history_complete(db: sqlite3.Connection) -> None:
+        """Record that every history page was enumerated and cached"""
+        db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('complete', '1')")
+
+    def _replay_history(
+        self, db: sqlite3.Connection, seen: set[str]
+    ) -> Iterator[ImageInfo]:
+        """Yield cached history items whose hash was not yielded this run"""
+        rows = db.execute(f"SELECT {', '.join(_HISTORY_COLUMNS)} FROM history")
+        for row in rows:
+            item = dict(zip(_HISTORY_COLUMNS, row, strict=True))
+            if item["hash"] in seen:
+                continue
+            item["delete"] = item.pop("delete_url")
+            item["storename"] = item.pop("filename")
+            info = self._image_info_from_item(item)
+            if info is not None:
+                yield info
+
+    def _iter_pages(self) -> Iterator[list[dict]]:
+        """Yield raw upload-history pages in order
+
+        The first page is fetched synchronously to learn the total page
+        count; the remaining pages are then fetched concurrently (four
+        at a time, the session's retry policy handles 429 backoff) and
+        yielded in page order. Closing the iterator early cancels any
+        pages not yet started.
+
+        Yields
+        ------
+        list[dict]
+            Raw image items of one page.
+        """
+        self._pages_truncated = False
+        images, current_page, total_pages = self._fetch_page(1)
+        if not images:
+            return
+        yield images
+
+        if total_pages <= current_page:
+            return
+
+        remaining = range(current_page + 1, total_pages + 1)
+        with ThreadPoolExecutor(max_workers=min(4, len(remaining))) as executor:
+            futures = {
+                page: executor.submit(self._fetch_page, page) for page in remaining
+            }
+            try:
+                for page in remaining:
+                    page_images, _, _ = futures[page].result()
+                    if not page_images:
+                        # Known total not reached: a fetch failed or
+                        # the history shrank mid-run
+                        self._pages_truncated = True
+                        break
+                    yield page_images
+            finally:
+                for future in futures.values():
+                    future.cancel()
+
     def list_images(self, limit: int | None = None) -> Iterator[ImageInfo]:
         """List all images in SM.MS
 
+        Pages are fetched concurrently once the total count is known
+        from the first response. Pages already seen on a previous run
+        are served from a local cache: history is append-only, so once
+        a page starts with a known item the remainder is replayed
+        without further requests.
+
         Parameters
         ----------
         limit : int, optional
@@ -49,88 +310,86 @@ class SMSProvider(BaseProvider):
         ImageInfo
             Information about each image.
         """
+        db = self._history_db()
+        # Replaying cached rows is only safe when they were written by a
+        # complete enumeration; a --limit run caches a subset, and
+        # treating that subset as the whole history would drop images
+        can_replay = db is not None and self._history_is_complete(db)
+        pages = self._iter_pages()
         try:
-            headers = {"Authorization": self.config.api_token}
             count = 0
-            page = 1
+            seen: set[str] = set()
 
-            while True:
+            for images in pages:
                 if limit and count >= limit:
                     break
 
-                # Get user's images
-                response = requests.get(
-                    f"{self.api_base}/upload_history",
-                    headers=headers,
-                    params={"page": page},
-                    timeout=30,
+                first_hash = (
+                    images[0].get("hash") if isinstance(images[0], dict) else None
                 )
-
-                if response.status_code != 200:
-                    self.logger.error(
-                        f"Failed to get SM.MS image list: {response.status_code}"
-                    )
-                    break
-
-                data = response.json()
-
-                if not data.get("success") or not data.get("data"):
-                    self.logger.warning(
-                        "SM.MS API returned no data or unsuccessful response"
-                    )
-                    break
-
-                images = data["data"].get("data", [])
-                if not images:
-                    break
+                if can_replay and first_hash:
+                    known = db.execute(
+                        "SELECT 1 FROM history WHERE hash = ?", (first_hash,)
+                    ).fetchone()
+                    if known:
+                        # Everything from here on was cached on an
+                        # earlier run; replay instead of re-paginating
+                        for info in self._replay_history(db, seen):
+                            if limit and count >= limit:
+                                break
+                            yield info
+                            count += 1
+                        break
 
                 for img in images:
                     if limit and count >= limit:
                         break
 
-                    # Validate image data
-                    if not img or not isinstance(img, dict):
-                        continue
-
-                    # Get URL - required field
-                    url = img.get("url")
-                    if not url:
+                    info = self._image_info_from_item(img)
+                    if info is None:
                         continue
 
-                    # Get filename (from storename or extract from link)
-                    filename = img.get("storename") or Path(url).name
-
-                    yield ImageInfo(
-                        url=url,
-                        filename=filename,
-                        size=img.get("size"),
-                        created_at=img.get("created_at"),  # Already in ISO format
-                        metadata={
-                            "hash": img.get("hash"),
-                            "delete": img.get("delete"),
-                            "page": img.get("page"),
-                            "path": img.get("path"),
-                            "width": img.get("width"),
-                            "height": img.get("height"),
-                        },
-                    )
+                    img_hash = (info.metadata or {}).get("hash")
+                    if db is not None and img_hash:
+                        seen.add(img_hash)
+                        meta = info.metadata or {}
+                        db.execute(
+                            "INSERT OR REPLACE INTO history "
+                            f"({', '.join(_HISTORY_COLUMNS)}) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (
+                                img_hash,
+                                info.url,
+                                info.filename,
+                                info.size,
+                                info.created_at,
+                                meta.get("page"),
+                                meta.get("path"),
+                                meta.get("width"),
+                                meta.get("height"),
+                                meta.get("delete"),
+                            ),
+                        )
+
+                    yield info
                     count += 1
 
-                # Check if there are more pages
-                current_page = data["data"].get("current_page", 1)
-                total_pages = data["data"].get("total_page", 1)
-
-                if current_page >= total_pages:
-                    break
-
-                page += 1
-
-                # Add delay to avoid frequent requests
-                time.sleep(0.1)
+                if db is not None:
+                    db.commit()
+            else:
+                # Every page was fetched and cached; only now may a
+                # later run replay the cache instead of re-paginating
+                if db is not None and limit is None and not self._pages_truncated:
+                    self._mark_history_complete(db)
 
         except Exception as e:
             self.logger.error(f"Failed to list SM.MS images: {e}")
             raise
+        finally:
+            pages.close()
+            if db is not None:
+                db.commit()
+                db.close()
 
     def download_image(self, image_info: ImageInfo, output_path: Path) -> bool:
         """Download image from SM.MS
@@ -149,18 +408,64 @@ class SMSProvider(BaseProvider):
         """
         try:
             # Ensure the output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if output_path.parent not in self._mkdir_cache:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                self._mkdir_cache.add(output_path.parent)
+
+            # Download into a .part file and publish atomically, so an
+            # interrupted transfer never masquerades as a complete image
+            # and the leftover bytes seed a Range resume on rerun
+            tmp = output_path.with_name(output_path.name + ".part")
+            headers = {}
+            offset = tmp.stat().st_size if tmp.exists() else 0
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
 
-            response = requests.get(image_info.url, timeout=30, stream=True)
-            response.raise_for_status()
+            while True:
+                with self.session.get(
+                    image_info.url, timeout=30, stream=True, headers=headers
+                ) as response:
+                    if response.status_code == 416 and headers:
+                        # The leftover .part already covers the whole
+                        # object (interrupted between the last write
+                        # and publish) or is stale for a changed
+                        # remote. Publish it when its size matches,
+                        # otherwise discard it and retry the request
+                        # without a Range header — never let one stale
+                        # .part fail this file on every future run
+                        if image_info.size is not None and offset == image_info.size:
+                            break
+                        tmp.unlink(missing_ok=True)
+                        headers = {}
+                        continue
 
-            with open(output_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                    if response.status_code == 206:
+                        mode = "ab"
+                    else:
+                        response.raise_for_status()
+                        mode = "wb"
 
+                    # Copy in a tight C loop with a 1 MiB buffer instead
+                    # of iterating Python-level chunks
+                    response.raw.decode_content = True
+                    with open(tmp, mode) as f:
+                        shutil.copyfileobj(response.raw, f, length=1 << 20)
+                break
+
+            os.replace(tmp, output_path)
             self.logger.debug(f"Successfully downloaded image: {image_info.filename}")
             return True
 
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if status and 400 <= status < 500 and status not in (408, 416, 429):
+                # Broken link or revoked access; retrying cannot help
+                # (416 is excluded: it only reflects local .part state)
+                raise ProviderPermanentError(
+                    f"HTTP {status} for {image_info.url}"
+                ) from e
+            self.logger.error(f"Failed to download image {image_info.filename}: {e}")
+            return False
         except Exception as e:
             self.logger.error(f"Failed to download image {image_info.filename}: {e}")
             return False
@@ -174,17 +479,9 @@ class SMSProvider(BaseProvider):
             The total number of images, or None if unable to determine.
         """
         try:
-            headers = {"Authorization": self.config.api_token}
-            response = requests.get(
-                f"{self.api_base}/profile", headers=headers, timeout=10
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("success"):
-                    profile_data = data.get("data", {})
-                    return profile_data.get("disk_usage", {}).get("image_count", 0)
-
+            profile = self._get_profile()
+            if profile is not None:
+                return profile.get("disk_usage", {}).get("image_count", 0)
             return None
         except Exception as e:
             self.logger.warning(f"Failed to get the total number of SM.MS images: {e}")
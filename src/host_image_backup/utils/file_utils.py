@@ -1,6 +1,11 @@
 import hashlib
+import os
+from functools import lru_cache
 from pathlib import Path
 
+# Single-pass replacement table for characters illegal in filenames
+_ILLEGAL_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
 
 class FileUtils:
     """File utility class for Host Image Backup.
@@ -10,9 +15,13 @@ class FileUtils:
     """
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def sanitize_filename(filename: str) -> str:
         """Sanitize filename by removing illegal characters.
 
+        Results are cached, since providers often hand back the same
+        templated names across a run.
+
         Parameters
         ----------
         filename : str
@@ -28,14 +37,13 @@ class FileUtils:
         >>> FileUtils.sanitize_filename("file*name?.jpg")
         'file_name_.jpg'
         """
-        # Replace illegal characters
-        illegal_chars = '<>:"/\\|?*'
-        for char in illegal_chars:
-            filename = filename.replace(char, "_")
+        # Replace illegal characters in one C-level pass
+        filename = filename.translate(_ILLEGAL_CHARS)
 
-        # Limit filename length
+        # Limit filename length; splitext does the name/extension
+        # split in one pass instead of building a Path twice
         if len(filename) > 255:
-            name, ext = Path(filename).stem, Path(filename).suffix
+            name, ext = os.path.splitext(filename)
             # Ensure we preserve the extension
             max_name_length = 255 - len(ext)
             if max_name_length > 0:
@@ -297,7 +305,7 @@ class FileUtils:
 
         # Limit length
         if len(filename) > 200:
-            name, ext = Path(filename).stem, Path(filename).suffix
+            name, ext = os.path.splitext(filename)
             max_name_length = 200 - len(ext)
             if max_name_length > 0:
                 filename = name[:max_name_length] + ext
@@ -1,11 +1,29 @@
 import hashlib
 import json
 import sqlite3
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# blake3 hashes several times faster than sha256 on large images;
+# optional (the "fast" extra), with hashlib as the fallback. The
+# algorithm actually used is pinned per metadata database so records
+# written before and after installing blake3 keep matching in
+# find_duplicates; see MetadataManager._init_database.
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+_HASH_CONSTRUCTORS = {
+    "sha256": hashlib.sha256,
+    **({"blake3": blake3.blake3} if blake3 is not None else {}),
+}
+
+_PREFERRED_ALGORITHM = "blake3" if blake3 is not None else "sha256"
+
 
 @dataclass
 class BackupRecord:
@@ -108,6 +126,16 @@ class MetadataManager:
             db_path = app_data_dir / "metadata.db"
 
         self.db_path = db_path
+        # Pending rows collected between begin_batch and flush_batch;
+        # writing them in one transaction amortizes the commit fsync
+        self._batching = False
+        self._batch_depth = 0
+        self._batch_lock = threading.Lock()
+        self._pending_backups: list[tuple] = []
+        self._pending_metadata: list[tuple] = []
+        # Hashes memoized by (inode, size, mtime_ns): an unchanged file
+        # keeps its key, so re-runs skip the full-file read entirely
+        self._hash_cache: dict[tuple[int, int, int], str] = {}
         self._init_database()
 
     def _init_database(self) -> None:
@@ -159,11 +187,60 @@ class MetadataManager:
                 ON image_metadata(file_hash)
             """)
 
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS file_hash_cache (
+                    file_path TEXT PRIMARY KEY,
+                    st_ino INTEGER NOT NULL,
+                    st_size INTEGER NOT NULL,
+                    st_mtime_ns INTEGER NOT NULL,
+                    algorithm TEXT NOT NULL,
+                    file_hash TEXT NOT NULL
+                )
+            """)
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS db_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+
+            # Pin the hash algorithm on first use so every record in
+            # this database is written with the same one; installing
+            # blake3 later must not make new hashes stop matching old
+            # sha256 records in find_duplicates
+            row = conn.execute(
+                "SELECT value FROM db_meta WHERE key = 'hash_algorithm'"
+            ).fetchone()
+            algorithm = row[0] if row else None
+            if algorithm not in _HASH_CONSTRUCTORS:
+                algorithm = _PREFERRED_ALGORITHM
+                conn.execute(
+                    "INSERT OR REPLACE INTO db_meta (key, value) VALUES "
+                    "('hash_algorithm', ?)",
+                    (algorithm,),
+                )
+            self.hash_algorithm = algorithm
+
             conn.commit()
 
+    def new_hash(self):
+        """Create a hash object using this database's pinned algorithm
+
+        Returns
+        -------
+        Any
+            A hashlib-compatible hash object (``update``/``hexdigest``).
+        """
+        return _HASH_CONSTRUCTORS[self.hash_algorithm]()
+
     def get_file_hash(self, file_path: Path) -> str:
         """Calculate file hash
 
+        Results are memoized by ``(st_ino, st_size, st_mtime_ns)`` both
+        in memory and in the metadata database, so files that have not
+        changed since a previous run are never re-read.
+
         Parameters
         ----------
         file_path : Path
@@ -172,13 +249,142 @@ class MetadataManager:
         Returns
         -------
         str
-            File hash (SHA256).
+            File hash (BLAKE3 when the ``fast`` extra is installed,
+            SHA256 otherwise).
         """
-        hash_sha256 = hashlib.sha256()
+        st = file_path.stat()
+        key = (st.st_ino, st.st_size, st.st_mtime_ns)
+
+        cached = self._hash_cache.get(key)
+        if cached is not None:
+            return cached
+
+        cached = self._lookup_cached_hash(file_path, key)
+        if cached is not None:
+            self._hash_cache[key] = cached
+            return cached
+
+        hasher = self.new_hash()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
+            # 1 MiB reads keep syscall count low on multi-MB images
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+        file_hash = hasher.hexdigest()
+
+        self._hash_cache[key] = file_hash
+        self._store_cached_hash(file_path, key, file_hash)
+        return file_hash
+
+    def prime_file_hash(self, file_path: Path, file_hash: str) -> None:
+        """Seed the hash caches with an already-computed digest
+
+        Called after a download has hashed the file as it was written,
+        so a later upload or re-run gets the hash without re-reading
+        the file. Best effort: a failed stat is simply skipped.
+
+        Parameters
+        ----------
+        file_path : Path
+            File path the digest belongs to.
+        file_hash : str
+            Digest computed with this database's pinned algorithm.
+        """
+        try:
+            st = file_path.stat()
+        except OSError:
+            return
+        key = (st.st_ino, st.st_size, st.st_mtime_ns)
+        self._hash_cache[key] = file_hash
+        self._store_cached_hash(file_path, key, file_hash)
+
+    def _lookup_cached_hash(
+        self, file_path: Path, key: tuple[int, int, int]
+    ) -> str | None:
+        """Read a persisted hash whose stat key and algorithm still match"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    """
+                    SELECT file_hash FROM file_hash_cache
+                    WHERE file_path = ? AND st_ino = ? AND st_size = ?
+                    AND st_mtime_ns = ? AND algorithm = ?
+                """,
+                    (str(file_path), *key, self.hash_algorithm),
+                ).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error:
+            return None
+
+    def _store_cached_hash(
+        self, file_path: Path, key: tuple[int, int, int], file_hash: str
+    ) -> None:
+        """Persist a computed hash for cross-process reuse, best effort"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO file_hash_cache
+                    (file_path, st_ino, st_size, st_mtime_ns, algorithm, file_hash)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                    (str(file_path), *key, self.hash_algorithm, file_hash),
+                )
+                conn.commit()
+        except sqlite3.Error:
+            pass
+
+    # Auto-flush threshold while batching, bounding memory and loss window
+    _BATCH_FLUSH_SIZE = 256
+
+    def begin_batch(self) -> None:
+        """Start collecting writes for batched commits
+
+        Until ``flush_batch`` is called, ``record_backup`` and
+        ``update_file_metadata`` queue their rows instead of opening a
+        connection and committing per call; queued rows are written in
+        one transaction every 256 entries and on flush.
+
+        Calls nest: when several backups share one manager (parallel
+        ``backup all``), each pairs its own begin/flush and batch mode
+        ends only when the outermost flush runs.
+        """
+        with self._batch_lock:
+            self._batch_depth += 1
+            self._batching = True
+
+    def flush_batch(self) -> None:
+        """Write all pending rows; leave batch mode at the outermost call"""
+        with self._batch_lock:
+            self._flush_pending_locked()
+            self._batch_depth = max(self._batch_depth - 1, 0)
+            self._batching = self._batch_depth > 0
+
+    def _flush_pending_locked(self) -> None:
+        """Write pending rows in one transaction; caller holds the lock"""
+        if not (self._pending_backups or self._pending_metadata):
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            if self._pending_backups:
+                conn.executemany(
+                    """
+                    INSERT INTO backup_records
+                    (operation, provider, file_path, remote_path, file_hash, file_size, status, message, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    self._pending_backups,
+                )
+            if self._pending_metadata:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO image_metadata
+                    (file_path, file_hash, file_size, width, height, format, exif_data, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    self._pending_metadata,
+                )
+            conn.commit()
+        self._pending_backups.clear()
+        self._pending_metadata.clear()
 
     def record_backup(
         self,
@@ -218,8 +424,30 @@ class MetadataManager:
         Returns
         -------
         int
-            Record ID.
+            Record ID, or 0 when the row was queued in batch mode.
         """
+        row = (
+            operation,
+            provider,
+            str(file_path),
+            remote_path,
+            file_hash,
+            file_size,
+            status,
+            message,
+            json.dumps(metadata) if metadata else None,
+        )
+
+        with self._batch_lock:
+            if self._batching:
+                self._pending_backups.append(row)
+                if (
+                    len(self._pending_backups) + len(self._pending_metadata)
+                    >= self._BATCH_FLUSH_SIZE
+                ):
+                    self._flush_pending_locked()
+                return 0
+
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -228,17 +456,7 @@ class MetadataManager:
                 (operation, provider, file_path, remote_path, file_hash, file_size, status, message, metadata)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-                (
-                    operation,
-                    provider,
-                    str(file_path),
-                    remote_path,
-                    file_hash,
-                    file_size,
-                    status,
-                    message,
-                    json.dumps(metadata) if metadata else None,
-                ),
+                row,
             )
             conn.commit()
             if cursor.lastrowid is None:
@@ -384,8 +602,29 @@ class MetadataManager:
         Returns
         -------
         int
-            Metadata ID.
+            Metadata ID, or 0 when the row was queued in batch mode.
         """
+        row = (
+            str(file_path),
+            file_hash,
+            file_size,
+            width,
+            height,
+            format,
+            json.dumps(exif_data) if exif_data else None,
+            datetime.now().isoformat(),
+        )
+
+        with self._batch_lock:
+            if self._batching:
+                self._pending_metadata.append(row)
+                if (
+                    len(self._pending_backups) + len(self._pending_metadata)
+                    >= self._BATCH_FLUSH_SIZE
+                ):
+                    self._flush_pending_locked()
+                return 0
+
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -394,16 +633,7 @@ class MetadataManager:
                 (file_path, file_hash, file_size, width, height, format, exif_data, updated_at)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """,
-                (
-                    str(file_path),
-                    file_hash,
-                    file_size,
-                    width,
-                    height,
-                    format,
-                    json.dumps(exif_data) if exif_data else None,
-                    datetime.now().isoformat(),
-                ),
+                row,
             )
             conn.commit()
             if cursor.lastrowid is None:
@@ -412,22 +642,34 @@ class MetadataManager:
                 )
             return cursor.lastrowid
 
-    def find_duplicates(self) -> dict[str, list[str]]:
+    def find_duplicates(self, max_results: int | None = None) -> dict[str, list[str]]:
         """Find duplicate files by hash
 
+        Parameters
+        ----------
+        max_results : int, optional
+            Maximum number of duplicate groups to return. If None, all
+            groups are returned.
+
         Returns
         -------
         dict[str, list[str]]
             Dictionary mapping file hash to list of file paths.
         """
+        query = """
+            SELECT file_hash, GROUP_CONCAT(file_path) as files
+            FROM image_metadata
+            GROUP BY file_hash
+            HAVING COUNT(*) > 1
+        """
+        params: list = []
+        if max_results:
+            query += " LIMIT ?"
+            params.append(max_results)
+
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT file_hash, GROUP_CONCAT(file_path) as files
-                FROM image_metadata
-                GROUP BY file_hash
-                HAVING COUNT(*) > 1
-            """)
+            cursor.execute(query, params)
             rows = cursor.fetchall()
 
         duplicates = {}
@@ -0,0 +1,107 @@
+"""Test backup core module."""
+
+import sqlite3
+import struct
+from pathlib import Path
+
+from src.host_image_backup.core.backup import _parse_image_header
+from src.host_image_backup.utils.metadata import MetadataManager
+
+
+class TestParseImageHeader:
+    """Test the pure-Python image header parser."""
+
+    def test_png(self):
+        """Test parsing PNG dimensions."""
+        head = (
+            b"\x89PNG\r\n\x1a\n"
+            + b"\x00\x00\x00\x0dIHDR"
+            + struct.pack(">II", 640, 480)
+        )
+        assert _parse_image_header(head) == (640, 480, "PNG")
+
+    def test_gif(self):
+        """Test parsing GIF dimensions."""
+        head = b"GIF89a" + struct.pack("<HH", 320, 200)
+        assert _parse_image_header(head) == (320, 200, "GIF")
+
+    def test_jpeg(self):
+        """Test parsing JPEG dimensions from the start-of-frame marker."""
+        app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+        sof0 = (
+            b"\xff\xc0"
+            + struct.pack(">H", 17)
+            + b"\x08"
+            + struct.pack(">HH", 480, 640)
+        )
+        head = b"\xff\xd8" + app0 + sof0 + b"\x00" * 16
+        assert _parse_image_header(head) == (640, 480, "JPEG")
+
+    def test_webp_vp8x(self):
+        """Test parsing extended WebP canvas dimensions."""
+        head = (
+            b"RIFF"
+            + b"\x00\x00\x00\x00"
+            + b"WEBP"
+            + b"VP8X"
+            + b"\x0a\x00\x00\x00"
+            + b"\x00\x00\x00\x00"
+            + (99).to_bytes(3, "little")
+            + (49).to_bytes(3, "little")
+        )
+        assert _parse_image_header(head) == (100, 50, "WEBP")
+
+    def test_unrecognized(self):
+        """Test that unknown or truncated headers return None."""
+        assert _parse_image_header(b"\x00" * 64) is None
+        assert _parse_image_header(b"") is None
+        # PNG signature without a complete IHDR chunk
+        assert _parse_image_header(b"\x89PNG\r\n\x1a\n") is None
+
+
+class TestMetadataBatchReentrancy:
+    """Test nested begin_batch/flush_batch on a shared manager."""
+
+    def _record(self, manager, provider):
+        """Record one successful backup row for the given provider."""
+        manager.record_backup(
+            operation="backup",
+            provider=provider,
+            file_path=Path(f"{provider}.png"),
+            remote_path=f"{provider}.png",
+            file_hash="deadbeef",
+            file_size=1,
+            status="success",
+        )
+
+    def test_inner_flush_keeps_batch_mode(self, tmp_path):
+        """Test that an inner flush does not end the outer batch."""
+        manager = MetadataManager(tmp_path / "metadata.db")
+        manager.begin_batch()
+        manager.begin_batch()
+        self._record(manager, "first")
+        manager.flush_batch()
+        assert manager._batching
+
+        # Rows recorded after the inner flush must still be queued,
+        # not committed per call
+        self._record(manager, "second")
+        assert manager._pending_backups
+
+        manager.flush_batch()
+        assert not manager._batching
+        with sqlite3.connect(tmp_path / "metadata.db") as conn:
+            count = conn.execute("SELECT COUNT(*) FROM backup_records").fetchone()[0]
+        assert count == 2
+
+    def test_extra_flush_is_harmless(self, tmp_path):
+        """Test that an unpaired flush leaves the manager usable."""
+        manager = MetadataManager(tmp_path / "metadata.db")
+        manager.flush_batch()
+        assert not manager._batching
+        manager.begin_batch()
+        self._record(manager, "only")
+        manager.flush_batch()
+        with sqlite3.connect(tmp_path / "metadata.db") as conn:
+            count = conn.execute("SELECT COUNT(*) FROM backup_records").fetchone()[0]
+        assert count == 1
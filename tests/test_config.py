@@ -146,3 +146,74 @@ class TestAppConfig:
 
         config = AppConfig(max_concurrent_downloads=20)  # maximum
         assert config.max_concurrent_downloads == 20
+
+
+class TestAppConfigSnapshotCache:
+    """Test the JSON snapshot cache used by AppConfig.load."""
+
+    def test_load_writes_snapshot_cache(self, tmp_path):
+        """Loading a YAML config leaves a JSON snapshot beside it."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("timeout: 60\n")
+
+        config = AppConfig.load(config_file)
+
+        assert config.timeout == 60
+        assert list(tmp_path.glob("config.yaml.*.json"))
+
+    def test_edited_yaml_invalidates_cache(self, tmp_path):
+        """Editing the YAML must miss the snapshot, not shadow the edit."""
+        import os
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("timeout: 60\n")
+        assert AppConfig.load(config_file).timeout == 60
+
+        config_file.write_text("timeout: 90\n")
+        # Force a different mtime even on coarse filesystem clocks
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert AppConfig.load(config_file).timeout == 90
+
+
+class TestConfigManagerSentinelCache:
+    """Test the parsed-config sentinel cache in ConfigManager."""
+
+    def test_edited_yaml_misses_sentinel(self, tmp_path):
+        """A changed YAML mtime/size must bypass the cached AppConfig."""
+        import os
+
+        from src.host_image_backup.config import ConfigManager
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("timeout: 60\n")
+
+        manager = ConfigManager(config_file)
+        assert manager.load_config(config_file).timeout == 60
+        sentinel = config_file.with_name(".config.yaml.cache.pkl")
+        assert sentinel.exists()
+
+        config_file.write_text("timeout: 90\n")
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        fresh_manager = ConfigManager(config_file)
+        assert fresh_manager.load_config(config_file).timeout == 90
+
+    def test_save_config_invalidates_sentinel(self, tmp_path):
+        """save_config must drop the sentinel so the next load re-parses."""
+        from src.host_image_backup.config import ConfigManager
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("timeout: 60\n")
+
+        manager = ConfigManager(config_file)
+        config = manager.load_config(config_file)
+        sentinel = config_file.with_name(".config.yaml.cache.pkl")
+        assert sentinel.exists()
+
+        config.timeout = 90
+        manager.save_config(config, config_file)
+
+        assert not sentinel.exists()
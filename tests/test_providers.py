@@ -101,3 +101,162 @@ class TestProviderImports:
         """Test GitHubProvider import."""
         assert GitHubProvider is not None
         assert issubclass(GitHubProvider, BaseProvider)
+
+
+class TestSMSHistoryCache:
+    """Regression tests for the SM.MS local upload-history cache."""
+
+    PAGE_SIZE = 5
+    TOTAL = 25
+
+    def _make_provider(self, monkeypatch, tmp_path):
+        """Build an SMSProvider against a fake paginated API and tmp cache."""
+        from src.host_image_backup.config.config_models import SMSConfig
+        from src.host_image_backup.providers import sms as sms_module
+
+        monkeypatch.setattr(
+            sms_module, "_HISTORY_CACHE", tmp_path / "sms_history.sqlite"
+        )
+
+        class _TestSMSProvider(sms_module.SMSProvider):
+            def upload_image(self, file_path, remote_path=None):
+                raise NotImplementedError
+
+        provider = _TestSMSProvider(SMSConfig(name="sms", api_token="token"))
+
+        items = [
+            {
+                "hash": f"hash{i}",
+                "url": f"https://sm.ms/image/{i}.jpg",
+                "storename": f"{i}.jpg",
+            }
+            for i in range(self.TOTAL)
+        ]
+        total_pages = self.TOTAL // self.PAGE_SIZE
+
+        def fetch_page(page):
+            start = (page - 1) * self.PAGE_SIZE
+            return items[start : start + self.PAGE_SIZE], page, total_pages
+
+        monkeypatch.setattr(provider, "_fetch_page", fetch_page)
+        return provider
+
+    def test_limited_run_does_not_poison_cache(self, monkeypatch, tmp_path):
+        """A --limit run must not make a later full run replay its subset."""
+        provider = self._make_provider(monkeypatch, tmp_path)
+
+        limited = list(provider.list_images(limit=5))
+        assert len(limited) == 5
+
+        full = list(provider.list_images())
+        assert len(full) == self.TOTAL
+
+    def test_complete_run_enables_replay(self, monkeypatch, tmp_path):
+        """After a full enumeration, later runs replay from the cache."""
+        provider = self._make_provider(monkeypatch, tmp_path)
+        assert len(list(provider.list_images())) == self.TOTAL
+
+        fetched_pages = []
+        original_fetch = provider._fetch_page
+
+        def counting_fetch(page):
+            fetched_pages.append(page)
+            return original_fetch(page)
+
+        monkeypatch.setattr(provider, "_fetch_page", counting_fetch)
+
+        replayed = {info.filename for info in provider.list_images()}
+        assert len(replayed) == self.TOTAL
+        # Only page 1 is fetched to detect new uploads; the rest replays
+        assert fetched_pages == [1]
+
+    def test_clear_listing_cache_removes_file(self, monkeypatch, tmp_path):
+        """clear_listing_cache (the --refresh hook) drops the cache file."""
+        from src.host_image_backup.providers import sms as sms_module
+
+        provider = self._make_provider(monkeypatch, tmp_path)
+        list(provider.list_images())
+        assert sms_module._HISTORY_CACHE.exists()
+
+        provider.clear_listing_cache()
+        assert not sms_module._HISTORY_CACHE.exists()
+
+
+class TestSMSDownloadResume:
+    """Regression tests for the SM.MS Range-resume download path."""
+
+    @staticmethod
+    def _provider():
+        from src.host_image_backup.config.config_models import SMSConfig
+        from src.host_image_backup.providers import sms as sms_module
+
+        class _TestSMSProvider(sms_module.SMSProvider):
+            def upload_image(self, file_path, remote_path=None):
+                raise NotImplementedError
+
+        return _TestSMSProvider(SMSConfig(name="sms", api_token="token"))
+
+    @staticmethod
+    def _response(status, body=b""):
+        import io
+        from unittest.mock import MagicMock
+
+        import requests
+
+        class _Raw(io.BytesIO):
+            """BytesIO that accepts the decode_content attribute."""
+
+        response = MagicMock()
+        response.status_code = status
+        response.raw = _Raw(body)
+        response.__enter__.return_value = response
+        response.__exit__.return_value = False
+        if status >= 400:
+            response.raise_for_status.side_effect = requests.HTTPError(
+                response=response
+            )
+        else:
+            response.raise_for_status.return_value = None
+        return response
+
+    def test_stale_part_falls_back_to_full_download(self, tmp_path, monkeypatch):
+        """A 416 for a stale .part must discard it and re-download fully."""
+        provider = self._provider()
+        output = tmp_path / "img.jpg"
+        part = tmp_path / "img.jpg.part"
+        part.write_bytes(b"stale")
+
+        responses = [self._response(416), self._response(200, b"fresh-bytes")]
+        sent_headers = []
+
+        def fake_get(url, timeout=30, stream=True, headers=None):
+            sent_headers.append(dict(headers or {}))
+            return responses.pop(0)
+
+        monkeypatch.setattr(provider.session, "get", fake_get)
+
+        info = ImageInfo(url="https://sm.ms/img.jpg", filename="img.jpg", size=11)
+        assert provider.download_image(info, output)
+        assert output.read_bytes() == b"fresh-bytes"
+        assert not part.exists()
+        assert "Range" in sent_headers[0]
+        assert "Range" not in sent_headers[1]
+
+    def test_complete_part_is_published(self, tmp_path, monkeypatch):
+        """A 416 for a size-matching .part publishes it without re-download."""
+        provider = self._provider()
+        output = tmp_path / "img.jpg"
+        part = tmp_path / "img.jpg.part"
+        part.write_bytes(b"fresh-bytes")
+
+        responses = [self._response(416)]
+        monkeypatch.setattr(
+            provider.session,
+            "get",
+            lambda url, timeout=30, stream=True, headers=None: responses.pop(0),
+        )
+
+        info = ImageInfo(url="https://sm.ms/img.jpg", filename="img.jpg", size=11)
+        assert provider.download_image(info, output)
+        assert output.read_bytes() == b"fresh-bytes"
+        assert not part.exists()